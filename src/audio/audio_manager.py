@@ -1,6 +1,8 @@
 """Audio manager for music and sound effects."""
 
+import os
 import pygame
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Optional
 from ..core.config_manager import ConfigManager
 from ..core.event_bus import EventBus, GameEvent, EventData
@@ -9,6 +11,13 @@ from ..core.event_bus import EventBus, GameEvent, EventData
 class AudioManager:
     """Manages all game audio - music and sound effects."""
 
+    # Snacks with their own collect sound; everything else plays "point_earned"
+    _SNACK_SOUND_MAP: Dict[str, str] = {
+        "broccoli": "broccoli",
+        "red_bull": "red_bull",
+        "chilli": "chilli",
+    }
+
     def __init__(self, config: ConfigManager, event_bus: EventBus):
         """
         Initialize the audio manager.
@@ -27,22 +36,48 @@ class AudioManager:
         self.music_enabled = config.get("audio_settings.music_enabled", True)
         self.sfx_enabled = config.get("audio_settings.sfx_enabled", True)
 
-        # Sound cache
+        # Effective volumes, recomputed only when a volume setting changes
+        self._effective_sfx_volume = self.master_volume * self.sfx_volume
+        self._effective_music_volume = self.master_volume * self.music_volume
+        self._last_set_volume: Dict[str, float] = {}
+
+        # Sound cache - sounds are registered by path and decoded in the
+        # background once the mixer is up
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self._sound_paths: Dict[str, str] = {}
+        self._pending_sounds: Dict[str, Future] = {}
+        self._loader: Optional[ThreadPoolExecutor] = None
         self.current_music: Optional[str] = None
 
-        # Initialize pygame mixer
-        self._init_mixer()
+        # Mixer is initialized lazily on first playback; a failed init is not retried
+        self._mixer_ready = False
+        self._mixer_failed = False
 
         # Subscribe to audio events
         self._subscribe_events()
 
-    def _init_mixer(self) -> None:
-        """Initialize pygame mixer."""
+    def _ensure_mixer(self) -> bool:
+        """
+        Initialize pygame mixer on first use and start decoding every
+        registered sound in the background.
+
+        Returns:
+            True if audio is available
+        """
+        if self._mixer_ready:
+            return True
+        if self._mixer_failed:
+            return False
         try:
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
         except pygame.error as e:
             print(f"Warning: Could not initialize audio mixer: {e}")
+            self._mixer_failed = True
+            return False
+        self._mixer_ready = True
+        for name in self._sound_paths:
+            self._queue_sound(name)
+        return True
 
     def _subscribe_events(self) -> None:
         """Subscribe to audio-related events."""
@@ -79,17 +114,9 @@ class AudioManager:
     def _on_snack_collected(self, event: EventData) -> None:
         """Play sound when snack is collected."""
         snack_id = event.payload.get("snack_id", "")
-        # Play dog eat sound for all snacks
+        # Play dog eat sound for all snacks, then the snack-specific sound
         self.play_sound("dog_eat")
-        # Play specific sounds for special snacks
-        if snack_id == "broccoli":
-            self.play_sound("broccoli")
-        elif snack_id == "red_bull":
-            self.play_sound("red_bull")
-        elif snack_id == "chilli":
-            self.play_sound("chilli")
-        else:
-            self.play_sound("point_earned")
+        self.play_sound(self._SNACK_SOUND_MAP.get(snack_id, "point_earned"))
 
     def _on_powerup(self, event: EventData) -> None:
         """Play sound when powerup activates."""
@@ -111,30 +138,81 @@ class AudioManager:
         self.sfx_volume = self.config.get("audio_settings.sfx_volume", 0.8)
         self.music_enabled = self.config.get("audio_settings.music_enabled", True)
         self.sfx_enabled = self.config.get("audio_settings.sfx_enabled", True)
+        self._update_effective_volumes()
 
         # Update music volume if playing
-        if pygame.mixer.music.get_busy():
-            effective_volume = self.master_volume * self.music_volume
-            pygame.mixer.music.set_volume(effective_volume if self.music_enabled else 0)
+        if self._mixer_ready and pygame.mixer.music.get_busy():
+            pygame.mixer.music.set_volume(self._effective_music_volume if self.music_enabled else 0)
+
+    def _update_effective_volumes(self) -> bool:
+        """
+        Recompute cached effective volumes.
+
+        Returns:
+            True if the effective music volume changed
+        """
+        self._effective_sfx_volume = self.master_volume * self.sfx_volume
+        music_volume = self.master_volume * self.music_volume
+        changed = music_volume != self._effective_music_volume
+        self._effective_music_volume = music_volume
+        return changed
 
     def load_sound(self, name: str, path: str) -> bool:
         """
-        Load a sound effect.
+        Register a sound effect. The file is decoded in the background
+        once the mixer has been initialized.
 
         Args:
             name: Name to reference the sound
             path: File path to the sound
 
         Returns:
-            True if loaded successfully
+            True if the sound file exists
         """
+        if not os.path.exists(path):
+            print(f"Warning: Could not load sound {path}: file not found")
+            return False
+        self._sound_paths[name] = path
+        if self._mixer_ready:
+            self._queue_sound(name)
+        return True
+
+    def _queue_sound(self, name: str) -> None:
+        """Start decoding a registered sound on the background loader."""
+        if name in self.sounds or name in self._pending_sounds:
+            return
+        if self._loader is None:
+            self._loader = ThreadPoolExecutor(max_workers=1)
+        self._pending_sounds[name] = self._loader.submit(pygame.mixer.Sound, self._sound_paths[name])
+
+    def _get_sound(self, name: str) -> Optional[pygame.mixer.Sound]:
+        """
+        Get a loaded sound.
+
+        A sound whose background load has not finished yet is decoded (or
+        waited for) here, so its first play is never dropped.
+
+        Returns None for unknown sounds or sounds that failed to load.
+        """
+        sound = self.sounds.get(name)
+        if sound is not None:
+            return sound
+
+        future = self._pending_sounds.pop(name, None)
+        if future is None:
+            return None
+
         try:
-            sound = pygame.mixer.Sound(path)
-            self.sounds[name] = sound
-            return True
+            if future.cancel():
+                # Still queued behind other sounds - decode it right away
+                sound = pygame.mixer.Sound(self._sound_paths[name])
+            else:
+                sound = future.result()
         except pygame.error as e:
-            print(f"Warning: Could not load sound {path}: {e}")
-            return False
+            print(f"Warning: Could not load sound {self._sound_paths.pop(name)}: {e}")
+            return None
+        self.sounds[name] = sound
+        return sound
 
     def play_sound(self, name: str) -> None:
         """
@@ -143,15 +221,17 @@ class AudioManager:
         Args:
             name: Name of the sound to play
         """
-        if not self.sfx_enabled:
+        if not self.sfx_enabled or not self._ensure_mixer():
             return
 
-        if name in self.sounds:
-            sound = self.sounds[name]
-            effective_volume = self.master_volume * self.sfx_volume
-            sound.set_volume(effective_volume)
+        sound = self._get_sound(name)
+        if sound is not None:
+            volume = self._effective_sfx_volume
+            if self._last_set_volume.get(name) != volume:
+                sound.set_volume(volume)
+                self._last_set_volume[name] = volume
             sound.play()
-        # Silently ignore missing sounds (no audio files yet)
+        # Silently ignore missing sounds
 
     def play_music(self, name: str, loop: bool = True) -> None:
         """
@@ -161,7 +241,7 @@ class AudioManager:
             name: Name/path of the music to play
             loop: Whether to loop the music
         """
-        if not self.music_enabled:
+        if not self.music_enabled or not self._ensure_mixer():
             return
 
         # For now, just track what should be playing
@@ -178,38 +258,37 @@ class AudioManager:
         Args:
             fadeout_ms: Fadeout duration in milliseconds
         """
-        if pygame.mixer.get_init():
+        if self._mixer_ready:
             pygame.mixer.music.fadeout(fadeout_ms)
         self.current_music = None
 
     def pause_music(self) -> None:
         """Pause the current music."""
-        if pygame.mixer.get_init():
+        if self._mixer_ready:
             pygame.mixer.music.pause()
 
     def resume_music(self) -> None:
         """Resume paused music."""
-        if pygame.mixer.get_init() and self.music_enabled:
+        if self.music_enabled and self._mixer_ready:
             pygame.mixer.music.unpause()
 
     def set_music_volume(self, volume: float) -> None:
         """Set music volume (0.0 to 1.0)."""
         self.music_volume = max(0.0, min(1.0, volume))
-        if pygame.mixer.get_init():
-            effective_volume = self.master_volume * self.music_volume
-            pygame.mixer.music.set_volume(effective_volume)
+        if self._update_effective_volumes() and self._mixer_ready:
+            pygame.mixer.music.set_volume(self._effective_music_volume)
 
     def set_sfx_volume(self, volume: float) -> None:
         """Set sound effects volume (0.0 to 1.0)."""
         self.sfx_volume = max(0.0, min(1.0, volume))
+        self._update_effective_volumes()
 
     def set_master_volume(self, volume: float) -> None:
         """Set master volume (0.0 to 1.0)."""
         self.master_volume = max(0.0, min(1.0, volume))
         # Update music volume
-        if pygame.mixer.get_init():
-            effective_volume = self.master_volume * self.music_volume
-            pygame.mixer.music.set_volume(effective_volume)
+        if self._update_effective_volumes() and self._mixer_ready:
+            pygame.mixer.music.set_volume(self._effective_music_volume)
 
     def toggle_music(self) -> bool:
         """Toggle music on/off. Returns new state."""
@@ -226,6 +305,12 @@ class AudioManager:
     def cleanup(self) -> None:
         """Clean up audio resources."""
         self.stop_music(0)
+        if self._loader is not None:
+            self._loader.shutdown(wait=True, cancel_futures=True)
+            self._loader = None
+        self._pending_sounds.clear()
         self.sounds.clear()
-        if pygame.mixer.get_init():
+        self._last_set_volume.clear()
+        if self._mixer_ready:
             pygame.mixer.quit()
+            self._mixer_ready = False
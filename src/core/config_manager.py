@@ -2,7 +2,32 @@
 
 import json
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson  # Optional faster JSON backend
+except ImportError:
+    orjson = None
+
+# Marks a dotted path that resolved to nothing in the lookup cache
+_MISSING = object()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump(data: Any, file_path: str) -> None:
+    """Write data to file_path as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2)
 
 
 class ConfigManager:
@@ -15,6 +40,12 @@ class ConfigManager:
             cls._instance = super().__new__(cls)
             cls._instance._configs: Dict[str, Dict] = {}
             cls._instance._config_dir: str = ""
+            cls._instance._cache: Dict[str, Any] = {}
+            # (mtime_ns, size) of each config file when it was last parsed
+            cls._instance._file_stamps: Dict[str, Tuple[int, int]] = {}
+            cls._instance._char_by_id: Dict[str, Dict] = {}
+            cls._instance._snack_by_id: Dict[str, Dict] = {}
+            cls._instance._level_by_number: Dict[int, Dict] = {}
         return cls._instance
 
     def initialize(self, config_dir: str) -> None:
@@ -41,17 +72,42 @@ class ConfigManager:
         for config_name in config_files:
             self._load_config(config_name)
 
+        self._build_indexes()
+
+    def _build_indexes(self, config_name: Optional[str] = None) -> None:
+        """
+        Build id lookup tables for characters, snacks and levels.
+
+        Args:
+            config_name: Only rebuild the index backed by this config;
+                rebuilds all of them when None
+        """
+        if config_name in (None, "characters"):
+            self._char_by_id = {c.get("id"): c for c in self.get("characters.characters", [])}
+        if config_name in (None, "snacks"):
+            self._snack_by_id = {s.get("id"): s for s in self.get("snacks.snacks", [])}
+        if config_name in (None, "levels"):
+            self._level_by_number = {l.get("level_number"): l for l in self.get("levels.levels", [])}
+
     def _load_config(self, config_name: str) -> None:
-        """Load a single config file."""
+        """Load a single config file, skipping the parse if it is unchanged on disk."""
         file_path = os.path.join(self._config_dir, f"{config_name}.json")
         try:
-            with open(file_path, 'r') as f:
-                self._configs[config_name] = json.load(f)
+            st = os.stat(file_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            if self._file_stamps.get(file_path) == stamp and config_name in self._configs:
+                return
+            self._cache.clear()
+            with open(file_path, 'rb') as f:
+                self._configs[config_name] = _loads(f.read())
+            self._file_stamps[file_path] = stamp
         except FileNotFoundError:
             print(f"Warning: Config file not found: {file_path}")
+            self._cache.clear()
             self._configs[config_name] = {}
         except json.JSONDecodeError as e:
             print(f"Error parsing config file {file_path}: {e}")
+            self._cache.clear()
             self._configs[config_name] = {}
 
     def get_config(self, config_name: str) -> Dict:
@@ -63,9 +119,15 @@ class ConfigManager:
         Get a config value using dot notation.
         Example: config.get("game_settings.window.width")
         """
+        value = self._cache.get(path, _MISSING)
+        if value is _MISSING:
+            value = self._get_uncached(path)
+            self._cache[path] = value
+        return value if value is not None else default
+
+    def _get_uncached(self, path: str) -> Any:
+        """Resolve a dotted path against the loaded configs, or None if absent."""
         parts = path.split(".")
-        if not parts:
-            return default
 
         config_name = parts[0]
         config = self._configs.get(config_name, {})
@@ -74,23 +136,33 @@ class ConfigManager:
             if isinstance(config, dict):
                 config = config.get(part)
                 if config is None:
-                    return default
+                    return None
             else:
-                return default
+                return None
 
-        return config if config is not None else default
+        return config
+
+    def set(self, path: str, value: Any) -> None:
+        """
+        Set a config value in memory using dot notation (not saved to disk).
+        Example: config.set("game_settings.window.width", 1920)
+        """
+        parts = path.split(".")
+        config = self._configs.setdefault(parts[0], {})
+        for part in parts[1:-1]:
+            config = config.setdefault(part, {})
+        config[parts[-1]] = value
+        self._cache.clear()
+        self._build_indexes(parts[0])
 
     def reload_config(self, config_name: str) -> None:
         """Reload a specific config file (useful for hot-reloading during development)."""
         self._load_config(config_name)
+        self._build_indexes(config_name)
 
     def get_character(self, character_id: str) -> Optional[Dict]:
         """Get a character configuration by ID."""
-        characters = self.get("characters.characters", [])
-        for char in characters:
-            if char.get("id") == character_id:
-                return char
-        return None
+        return self._char_by_id.get(character_id)
 
     def get_all_characters(self) -> list:
         """Get all character configurations."""
@@ -98,11 +170,7 @@ class ConfigManager:
 
     def get_snack(self, snack_id: str) -> Optional[Dict]:
         """Get a snack configuration by ID."""
-        snacks = self.get("snacks.snacks", [])
-        for snack in snacks:
-            if snack.get("id") == snack_id:
-                return snack
-        return None
+        return self._snack_by_id.get(snack_id)
 
     def get_all_snacks(self) -> list:
         """Get all snack configurations."""
@@ -110,11 +178,7 @@ class ConfigManager:
 
     def get_level(self, level_number: int) -> Optional[Dict]:
         """Get a level configuration by number."""
-        levels = self.get("levels.levels", [])
-        for level in levels:
-            if level.get("level_number") == level_number:
-                return level
-        return None
+        return self._level_by_number.get(level_number)
 
     def get_difficulty(self, difficulty_name: str) -> Dict:
         """Get AI difficulty settings."""
@@ -123,20 +187,19 @@ class ConfigManager:
     def save_audio_settings(self) -> None:
         """Save audio settings back to file."""
         file_path = os.path.join(self._config_dir, "audio_settings.json")
-        with open(file_path, 'w') as f:
-            json.dump(self._configs.get("audio_settings", {}), f, indent=2)
+        _dump(self._configs.get("audio_settings", {}), file_path)
 
     def update_audio_setting(self, key: str, value: Any) -> None:
         """Update an audio setting and save."""
         if "audio_settings" in self._configs:
             self._configs["audio_settings"][key] = value
+            self._cache.clear()
             self.save_audio_settings()
 
     def save_admin_settings(self) -> None:
         """Save admin settings back to file."""
         file_path = os.path.join(self._config_dir, "admin_settings.json")
-        with open(file_path, 'w') as f:
-            json.dump(self._configs.get("admin_settings", {}), f, indent=2)
+        _dump(self._configs.get("admin_settings", {}), file_path)
 
     def update_admin_setting(self, section: str, key: str, value: Any) -> None:
         """Update a single admin setting value and persist to disk."""
@@ -145,6 +208,7 @@ class ConfigManager:
         if section not in self._configs["admin_settings"]:
             self._configs["admin_settings"][section] = {}
         self._configs["admin_settings"][section][key] = value
+        self._cache.clear()
         self.save_admin_settings()
 
     def get_admin_settings(self) -> Dict:
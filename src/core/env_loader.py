@@ -16,25 +16,29 @@ def _resolve_env_path(env_path: Optional[Path] = None) -> Path:
 
 
 def _parse_env_file(env_path: Path) -> Dict[str, str]:
-    """Parse .env file into key/value pairs."""
+    """Parse .env file into key/value pairs.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
     parsed: Dict[str, str] = {}
 
     with open(env_path, 'r') as f:
         for line in f:
             line = line.strip()
             # Skip empty lines and comments
-            if not line or line.startswith('#'):
+            if not line or line[0] == '#':
                 continue
             # Parse key=value
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                # Remove quotes if present
-                if (value.startswith('"') and value.endswith('"')) or \
-                   (value.startswith("'") and value.endswith("'")):
-                    value = value[1:-1]
-                parsed[key] = value
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+            key = key.strip()
+            value = value.strip()
+            # Remove quotes if present
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+                value = value[1:-1]
+            parsed[key] = value
 
     return parsed
 
@@ -53,13 +57,14 @@ def load_env(env_path: Optional[Path] = None) -> bool:
 
     env_path = _resolve_env_path(env_path)
 
-    if not env_path.exists():
+    try:
+        parsed = _parse_env_file(env_path)
+    except FileNotFoundError:
         if not _missing_env_warned:
             print(f"Warning: .env file not found at {env_path}. Create it from .env.example if needed.")
             _missing_env_warned = True
         return False
 
-    parsed = _parse_env_file(env_path)
     for key, value in parsed.items():
         os.environ[key] = value
 
@@ -78,11 +83,12 @@ def validate_required_env(required_keys: Sequence[str], env_path: Optional[Path]
     """
     resolved_env_path = _resolve_env_path(env_path)
 
-    if not resolved_env_path.exists():
+    try:
+        parsed = _parse_env_file(resolved_env_path)
+    except FileNotFoundError:
         load_env(resolved_env_path)
         return False, list(required_keys), False
 
-    parsed = _parse_env_file(resolved_env_path)
     for key, value in parsed.items():
         os.environ[key] = value
 
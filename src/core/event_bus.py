@@ -1,12 +1,17 @@
 """Event bus for pub/sub communication between game systems."""
 
-from enum import Enum, auto
-from typing import Callable, Dict, List, Any, Optional
+from enum import IntEnum, auto
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
+import bisect
+import itertools
 import time
 
+# Number of reusable EventData objects handed out by emit (power of two)
+EVENT_POOL_SIZE = 256
 
-class GameEvent(Enum):
+
+class GameEvent(IntEnum):
     """All game events."""
     # Gameplay Events
     SNACK_SPAWNED = auto()
@@ -46,20 +51,18 @@ class GameEvent(Enum):
     STOP_MUSIC = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class EventData:
     """Container for event data."""
     event_type: GameEvent
     payload: Dict[str, Any] = field(default_factory=dict)
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = field(default_factory=time.monotonic)
     source: str = "system"
 
 
-@dataclass
-class EventListener:
-    """Container for event listener info."""
-    callback: Callable[[EventData], None]
-    priority: int = 0
+# A subscribed listener: (-priority, subscription sequence number, callback).
+# Tuples sort higher priority first, then in subscription order.
+Listener = Tuple[int, int, Callable[[EventData], None]]
 
 
 class EventBus:
@@ -70,8 +73,20 @@ class EventBus:
     def __new__(cls) -> 'EventBus':
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._listeners: Dict[GameEvent, List[EventListener]] = {}
+            cls._instance._listeners: Dict[GameEvent, List[Listener]] = {}
+            cls._instance._seq = itertools.count()
+            # Priority-ordered callback snapshots used for dispatch
+            cls._instance._dispatch: Dict[GameEvent, Tuple[Callable[[EventData], None], ...]] = {}
+            # Reusable events for emit, handed out round-robin
+            cls._instance._event_pool: List[EventData] = [
+                EventData(GameEvent.SNACK_SPAWNED) for _ in range(EVENT_POOL_SIZE)
+            ]
+            cls._instance._pool_idx = 0
+            # Reusable event slots for queue_event; the first _queue_len are pending.
+            # Swapped with _spare_queue while the queue is processed.
             cls._instance._queued_events: List[EventData] = []
+            cls._instance._spare_queue: List[EventData] = []
+            cls._instance._queue_len = 0
         return cls._instance
 
     def subscribe(self, event_type: GameEvent, callback: Callable[[EventData], None],
@@ -80,67 +95,97 @@ class EventBus:
         Register a listener for an event type.
         Higher priority listeners are called first.
         """
-        if event_type not in self._listeners:
-            self._listeners[event_type] = []
-
-        listener = EventListener(callback=callback, priority=priority)
-        self._listeners[event_type].append(listener)
-        # Sort by priority (higher first)
-        self._listeners[event_type].sort(key=lambda x: x.priority, reverse=True)
+        # Insert in priority order (higher first, ties by subscription order)
+        bisect.insort(self._listeners.setdefault(event_type, []),
+                      (-priority, next(self._seq), callback))
+        self._rebuild_dispatch(event_type)
 
     def unsubscribe(self, event_type: GameEvent, callback: Callable) -> None:
         """Remove a listener."""
         if event_type in self._listeners:
             self._listeners[event_type] = [
                 l for l in self._listeners[event_type]
-                if l.callback != callback
+                if l[2] != callback
             ]
+            self._rebuild_dispatch(event_type)
+
+    def _rebuild_dispatch(self, event_type: GameEvent) -> None:
+        """Refresh the dispatch snapshot for one event type."""
+        listeners = self._listeners.get(event_type)
+        if listeners:
+            self._dispatch[event_type] = tuple(cb for _, _, cb in listeners)
+        else:
+            self._dispatch.pop(event_type, None)
 
     def emit(self, event_type: GameEvent, payload: Dict[str, Any] = None,
              source: str = "system") -> None:
-        """Emit an event immediately to all listeners."""
-        event = EventData(
-            event_type=event_type,
-            payload=payload or {},
-            source=source
-        )
+        """
+        Emit an event immediately to all listeners.
 
-        if event_type in self._listeners:
-            for listener in self._listeners[event_type]:
-                try:
-                    listener.callback(event)
-                except Exception as e:
-                    print(f"Error in event listener for {event_type}: {e}")
+        The EventData passed to listeners is reused by later emits, so
+        listeners must copy anything they need to keep after returning.
+        """
+        callbacks = self._dispatch.get(event_type)
+        if not callbacks:
+            return
+
+        event = self._event_pool[self._pool_idx]
+        self._pool_idx = (self._pool_idx + 1) & (EVENT_POOL_SIZE - 1)
+        event.event_type = event_type
+        event.payload = payload or {}
+        event.timestamp = time.monotonic()
+        event.source = source
+
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Error in event listener for {event_type.name}: {e}")
 
     def queue_event(self, event_type: GameEvent, payload: Dict[str, Any] = None,
                     source: str = "system") -> None:
         """Queue an event for deferred processing."""
-        event = EventData(
-            event_type=event_type,
-            payload=payload or {},
-            source=source
-        )
-        self._queued_events.append(event)
+        queue = self._queued_events
+        if self._queue_len < len(queue):
+            event = queue[self._queue_len]
+            event.event_type = event_type
+            event.payload = payload or {}
+            event.timestamp = time.monotonic()
+            event.source = source
+        else:
+            event = EventData(event_type=event_type, payload=payload or {}, source=source)
+            queue.append(event)
+        self._queue_len += 1
 
     def process_queue(self) -> None:
         """Process all queued events (call this each frame)."""
-        events_to_process = self._queued_events.copy()
-        self._queued_events.clear()
-
-        for event in events_to_process:
-            if event.event_type in self._listeners:
-                for listener in self._listeners[event.event_type]:
-                    try:
-                        listener.callback(event)
-                    except Exception as e:
-                        print(f"Error processing queued event {event.event_type}: {e}")
+        count = self._queue_len
+        if not count:
+            return
+
+        # Swap buffers so events queued by listeners land in the other one
+        events = self._queued_events
+        self._queued_events = self._spare_queue
+        self._spare_queue = events
+        self._queue_len = 0
+
+        dispatch = self._dispatch
+        for i in range(count):
+            event = events[i]
+            for callback in dispatch.get(event.event_type, ()):
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"Error processing queued event {event.event_type.name}: {e}")
 
     def clear_all(self) -> None:
         """Clear all listeners and queued events."""
         self._listeners.clear()
-        self._queued_events.clear()
+        self._dispatch.clear()
+        self._queue_len = 0
 
     def clear_listeners(self, event_type: GameEvent) -> None:
         """Clear all listeners for a specific event type."""
         if event_type in self._listeners:
             self._listeners[event_type].clear()
+        self._dispatch.pop(event_type, None)
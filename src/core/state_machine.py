@@ -1,13 +1,13 @@
 """Game state machine for managing screen transitions."""
 
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Dict, Optional, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..screens.base_screen import BaseScreen
 
 
-class GameState(Enum):
+class GameState(IntEnum):
     """All possible game states."""
     MAIN_MENU = auto()
     CHARACTER_SELECT = auto()
@@ -26,6 +26,23 @@ def _clamp(v: int, lo: int = 0, hi: int = 255) -> int:
     return max(lo, min(hi, v))
 
 
+# Bits returned by _effect_flags()
+_FLAG_BOOST = 1   # Red Bull boost
+_FLAG_SPEED = 2   # Any speed effect (speed_boost or boost)
+
+
+def _effect_flags(active_effects: List[Dict[str, Any]]) -> int:
+    """Summarize the active effects the VFX care about in a single pass."""
+    flags = 0
+    for e in active_effects:
+        effect_type = e["type"]
+        if effect_type == "boost":
+            flags |= _FLAG_BOOST | _FLAG_SPEED
+        elif effect_type == "speed_boost":
+            flags |= _FLAG_SPEED
+    return flags
+
+
 # ---------------------------------------------------------------------------
 # Wings Effect  (Red Bull / boost)
 # ---------------------------------------------------------------------------
@@ -574,6 +591,9 @@ class StatusIndicator:
         self.cfg = cfg
         self.time = 0.0
         self._icon_cache: Dict[str, pygame.Surface] = {}
+        # Pre-drawn timer bar pieces: background by size, fill by (type, width, height)
+        self._bar_bg_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._bar_fill_cache: Dict[Tuple[str, int, int], pygame.Surface] = {}
 
     def update(self, dt: float) -> None:
         self.time += dt
@@ -595,23 +615,16 @@ class StatusIndicator:
         bar_x = render_cx - bar_w // 2
         bar_y = render_top + bar_oy
 
-        # Background
-        bg = pygame.Surface((bar_w, bar_h), pygame.SRCALPHA)
-        pygame.draw.rect(bg, (0, 0, 0, 140), (0, 0, bar_w, bar_h), border_radius=3)
-        surface.blit(bg, (bar_x, bar_y))
-
-        # Fill
+        # Background, fill and icon above bar
         fill_w = max(1, int(bar_w * frac))
-        color = self._effect_color(effect_type)
-        fill = pygame.Surface((fill_w, bar_h), pygame.SRCALPHA)
-        pygame.draw.rect(fill, (*color, 220), (0, 0, fill_w, bar_h), border_radius=3)
-        surface.blit(fill, (bar_x, bar_y))
-
-        # Icon above bar
         icon = self._get_icon(effect_type, icon_size)
         ix = render_cx - icon_size // 2
         iy = render_top + icon_oy + int(bob)
-        surface.blit(icon, (ix, iy))
+        surface.blits((
+            (self._get_bar_bg(bar_w, bar_h), (bar_x, bar_y)),
+            (self._get_bar_fill(effect_type, fill_w, bar_h), (bar_x, bar_y)),
+            (icon, (ix, iy)),
+        ), doreturn=False)
 
     # -- internals -----------------------------------------------------------
 
@@ -625,6 +638,26 @@ class StatusIndicator:
             "slow": (60, 180, 60),
         }.get(effect_type, (200, 200, 200))
 
+    def _get_bar_bg(self, bar_w: int, bar_h: int) -> pygame.Surface:
+        key = (bar_w, bar_h)
+        bg = self._bar_bg_cache.get(key)
+        if bg is None:
+            bg = pygame.Surface((bar_w, bar_h), pygame.SRCALPHA)
+            pygame.draw.rect(bg, (0, 0, 0, 140), (0, 0, bar_w, bar_h), border_radius=3)
+            self._bar_bg_cache[key] = bg
+        return bg
+
+    def _get_bar_fill(self, effect_type: str, fill_w: int, bar_h: int) -> pygame.Surface:
+        # Bounded: one entry per whole-pixel width of each effect's bar
+        key = (effect_type, fill_w, bar_h)
+        fill = self._bar_fill_cache.get(key)
+        if fill is None:
+            color = self._effect_color(effect_type)
+            fill = pygame.Surface((fill_w, bar_h), pygame.SRCALPHA)
+            pygame.draw.rect(fill, (*color, 220), (0, 0, fill_w, bar_h), border_radius=3)
+            self._bar_fill_cache[key] = fill
+        return fill
+
     def _get_icon(self, effect_type: str, size: int) -> pygame.Surface:
         if effect_type in self._icon_cache:
             return self._icon_cache[effect_type]
@@ -803,8 +836,9 @@ class PowerUpVFXManager:
                facing_right: bool,
                is_flying: bool = False) -> None:
         """Update all sub-effects based on current active effects."""
-        has_boost = any(e["type"] == "boost" for e in active_effects)
-        has_speed = any(e["type"] in ("speed_boost", "boost") for e in active_effects)
+        flags = _effect_flags(active_effects)
+        has_boost = bool(flags & _FLAG_BOOST)
+        has_speed = bool(flags & _FLAG_SPEED)
         speed_type = "boost" if has_boost else "speed_boost"
 
         cx = player_x + player_w / 2
@@ -844,6 +878,7 @@ class PowerUpVFXManager:
         """Effects drawn *behind* the player sprite (call before blit)."""
         render_cx = render_x + sprite_w // 2
         render_cy = render_y + sprite_h // 2
+        flags = _effect_flags(active_effects)
 
         # Aura glow (behind sprite)
         for eff in active_effects:
@@ -852,16 +887,14 @@ class PowerUpVFXManager:
                                  sprite_w, sprite_h, eff["type"])
 
         # Wings (behind sprite, only for boost)
-        has_boost = any(e["type"] == "boost" for e in active_effects)
-        if has_boost and render_wings and self._cfg.get("wings", {}).get("enabled", True):
+        if flags & _FLAG_BOOST and render_wings and self._cfg.get("wings", {}).get("enabled", True):
             self.wings.render(surface, render_cx, render_cy,
                               sprite_w, sprite_h, facing_right,
                               arena_left, arena_top, offset,
                               is_flying=is_flying)
 
         # Speed streaks / afterimages (behind sprite)
-        has_speed = any(e["type"] in ("speed_boost", "boost") for e in active_effects)
-        if has_speed and self._cfg.get("speed_streaks", {}).get("enabled", True):
+        if flags & _FLAG_SPEED and self._cfg.get("speed_streaks", {}).get("enabled", True):
             self.streaks.render_behind(surface, sprite, render_x, render_y,
                                        arena_left, arena_top, offset)
 
@@ -876,10 +909,10 @@ class PowerUpVFXManager:
         """Effects drawn *in front of* the player sprite (call after blit)."""
         render_cx = render_x + sprite_w // 2
 
-        has_boost = any(e["type"] == "boost" for e in active_effects)
+        flags = _effect_flags(active_effects)
 
         # Front shoulder overlay so wings look attached to the dog body.
-        if has_boost and render_wings and self._cfg.get("wings", {}).get("enabled", True):
+        if flags & _FLAG_BOOST and render_wings and self._cfg.get("wings", {}).get("enabled", True):
             self.wings.render_attachment_overlay(
                 surface,
                 render_x,
@@ -890,8 +923,7 @@ class PowerUpVFXManager:
             )
 
         # Speed particles (in front)
-        has_speed = any(e["type"] in ("speed_boost", "boost") for e in active_effects)
-        if has_speed and self._cfg.get("speed_streaks", {}).get("enabled", True):
+        if flags & _FLAG_SPEED and self._cfg.get("speed_streaks", {}).get("enabled", True):
             self.streaks.render_front(surface, arena_left, arena_top, offset)
 
         # Status indicator (timer bar + icon) for each active effect
@@ -7,10 +7,30 @@ from typing import Dict, Any, List, Optional, Tuple
 from .player import Player
 from typing import Union
 
+_sqrt = math.sqrt
+
+# Number of precomputed pathfinding jitter pairs per AI (power of two)
+NOISE_RING_SIZE = 1024
+
+# A target within this horizontal distance is kept without rescanning...
+KEEP_TARGET_RANGE = 100
+# ...for at most this many decisions in a row
+MAX_KEPT_DECISIONS = 3
+
 
 class AIPlayer(Player):
     """An AI-controlled dog character."""
 
+    __slots__ = (
+        "reaction_delay", "decision_accuracy", "pathfinding_efficiency",
+        "avoids_penalties", "targets_powerups",
+        "_penalty_weight", "_speed_bonus", "_invinc_bonus", "_effect_bonus",
+        "_rand", "_random", "_uniform", "_choice", "_randint",
+        "_noise_ring", "_noise_idx",
+        "decision_timer", "current_target", "target_position", "_kept_decisions",
+        "_min_x", "_max_x",
+    )
+
     def __init__(self, character_config: Dict[str, Any], arena_bounds: pygame.Rect,
                  difficulty_config: Dict[str, Any], horizontal_only: bool = False):
         """
@@ -31,21 +51,43 @@ class AIPlayer(Player):
         self.avoids_penalties = difficulty_config.get("avoids_penalties", True)
         self.targets_powerups = difficulty_config.get("targets_powerups", True)
 
+        # Score weights derived from the difficulty flags
+        self._penalty_weight = -300.0 if self.avoids_penalties else 0.0
+        self._speed_bonus = 100.0 if self.targets_powerups else 0.0
+        self._invinc_bonus = 150.0 if self.targets_powerups else 0.0
+        # Indexed by the snack's effect_code (EFFECT_NONE, _SPEED_BOOST, _INVINCIBILITY)
+        self._effect_bonus: Tuple[float, float, float] = (
+            0.0, self._speed_bonus, self._invinc_bonus
+        )
+
+        # Per-AI random source with bound methods for the hot paths
+        self._rand = random.Random()
+        self._random = self._rand.random
+        self._uniform = self._rand.uniform
+        self._choice = self._rand.choice
+        self._randint = self._rand.randint
+
+        # Pathfinding jitter, drawn up front and cycled through
+        self._noise_ring: List[Tuple[float, float]] = [
+            (self._uniform(-0.3, 0.3), self._uniform(-0.3, 0.3))
+            for _ in range(NOISE_RING_SIZE)
+        ]
+        self._noise_idx = 0
+
         # AI state
         self.decision_timer = 0.0
         self.current_target: Optional[Any] = None
         self.target_position: Optional[Tuple[float, float]] = None
+        self._kept_decisions = 0
 
-    def update(self, dt: float, snacks: List[Any] = None) -> None:
+    def update(self, dt: float, snacks: Optional[List[Any]] = None) -> None:
         """
         Update AI player.
 
         Args:
             dt: Delta time in seconds
-            snacks: List of snacks in the arena
+            snacks: The arena's list of active snacks
         """
-        snacks = snacks or []
-
         # Update decision timer
         self.decision_timer -= dt
 
@@ -72,12 +114,18 @@ class AIPlayer(Player):
         new_y = self.y + self.velocity_y * dt
 
         # Clamp to arena bounds
-        new_x = max(self.arena_bounds.left, min(new_x, self.arena_bounds.right - self.width))
+        if new_x < self._min_x:
+            new_x = self._min_x
+        elif new_x > self._max_x:
+            new_x = self._max_x
         # Use flight ceiling when boosting so dog doesn't fly to the very top
-        min_y = self.arena_bounds.top
+        min_y = self._min_y
         if self.horizontal_only and self.has_boost_effect():
             min_y = self.get_flight_ceiling()
-        new_y = max(min_y, min(new_y, self.arena_bounds.bottom - self.height))
+        if new_y > self._max_y:
+            new_y = self._max_y
+        if new_y < min_y:
+            new_y = min_y
 
         self.x = new_x
         self.y = new_y
@@ -104,13 +152,26 @@ class AIPlayer(Player):
             self.current_target = None
             self.target_position = None
 
-    def make_decision(self, snacks: List[Any]) -> None:
+    def _cache_bounds(self) -> None:
+        """Recompute the position limits; the AI is clamped to the arena, not a leash."""
+        super()._cache_bounds()
+        self._min_x = self.arena_bounds.left
+        self._max_x = self.arena_bounds.right - self.width
+
+    def make_decision(self, snacks: Optional[List[Any]]) -> None:
         """
         Decide which snack to target.
 
         Args:
-            snacks: List of available snacks (Snack or FallingSnack objects)
+            snacks: List of active snacks (Snack or FallingSnack objects),
+                maintained by the arena
         """
+        if self._keep_current_target():
+            self._kept_decisions += 1
+            self.target_position = self.current_target.center
+            return
+        self._kept_decisions = 0
+
         if not snacks:
             self.current_target = None
             self.target_position = None
@@ -119,49 +180,41 @@ class AIPlayer(Player):
             if not can_move_vertical:
                 # Only wander horizontally
                 self.target_position = (
-                    random.randint(self.arena_bounds.left + 20, self.arena_bounds.right - 20),
+                    self._randint(self.arena_bounds.left + 20, self.arena_bounds.right - 20),
                     self.y + self.height // 2  # Stay at current Y
                 )
             else:
                 # Wander within the allowed flight zone
                 ceil = int(self.get_flight_ceiling()) if self.horizontal_only else self.arena_bounds.top + 10
                 self.target_position = (
-                    random.randint(self.arena_bounds.left + 10, self.arena_bounds.right - 10),
-                    random.randint(ceil, self.arena_bounds.bottom - 10)
+                    self._randint(self.arena_bounds.left + 10, self.arena_bounds.right - 10),
+                    self._randint(ceil, self.arena_bounds.bottom - 10)
                 )
             return
 
-        # Filter active snacks
-        active_snacks = [s for s in snacks if s.active]
-        if not active_snacks:
-            self.current_target = None
-            self.target_position = None
-            return
-
-        # Score each snack
-        scored_snacks = []
-        for snack in active_snacks:
-            score = self.evaluate_snack(snack)
-            scored_snacks.append((snack, score))
-
         # Sometimes make a suboptimal choice based on accuracy
-        if random.random() > self.decision_accuracy:
+        if self._random() > self.decision_accuracy:
             # Pick a random snack
-            self.current_target = random.choice(active_snacks)
+            self.current_target = self._choice(snacks)
         else:
-            # Pick the best snack
-            scored_snacks.sort(key=lambda x: x[1], reverse=True)
-            self.current_target = scored_snacks[0][0]
-
-        if self.current_target:
-            # Get center position - handle both Snack and FallingSnack
-            if hasattr(self.current_target, 'center'):
-                self.target_position = self.current_target.center
-            else:
-                self.target_position = (
-                    self.current_target.x + self.current_target.width / 2,
-                    self.current_target.y + self.current_target.height / 2
-                )
+            # Pick the best snack (first one on ties)
+            self.current_target = self.best_snack(snacks)
+
+        # Snack and FallingSnack both expose center
+        self.target_position = self.current_target.center
+
+    def _keep_current_target(self) -> bool:
+        """Check whether the current target is still close and worth chasing."""
+        target = self.current_target
+        if target is None or not target.active:
+            return False
+        if self._kept_decisions >= MAX_KEPT_DECISIONS:
+            return False
+        if self.avoids_penalties and target.point_value < 0:
+            return False
+        if abs(target.x - self.x) >= KEEP_TARGET_RANGE:
+            return False
+        return self.horizontal_only or target.y >= self.y
 
     def evaluate_snack(self, snack: Any) -> float:
         """
@@ -176,10 +229,8 @@ class AIPlayer(Player):
         # Base score is point value
         score = float(snack.point_value)
 
-        # Calculate distance
+        # Horizontal offset (the only distance the score uses)
         dx = snack.x - self.x
-        dy = snack.y - self.y
-        distance = math.sqrt(dx * dx + dy * dy)
 
         # For horizontal mode, prioritize snacks that are reachable (closer in Y)
         if self.horizontal_only:
@@ -194,17 +245,11 @@ class AIPlayer(Player):
         score -= abs(dx) * 0.5  # Horizontal distance matters most
 
         # Handle penalties (broccoli)
-        if snack.point_value < 0 and self.avoids_penalties:
-            score -= 300  # Strong penalty
+        if snack.point_value < 0:
+            score += self._penalty_weight
 
         # Bonus for power-ups
-        effect = getattr(snack, 'effect', None)
-        if effect and self.targets_powerups:
-            effect_type = effect.get("type") if isinstance(effect, dict) else None
-            if effect_type == "speed_boost":
-                score += 100
-            elif effect_type == "invincibility":
-                score += 150
+        score += self._effect_bonus[snack.effect_code]
 
         # Consider time remaining for static snacks (prioritize snacks about to despawn)
         time_alive = getattr(snack, 'time_alive', 0)
@@ -214,6 +259,27 @@ class AIPlayer(Player):
 
         return score
 
+    def best_snack(self, snacks: List[Any]) -> Any:
+        """
+        Find the most desirable snack in a single pass.
+
+        Args:
+            snacks: Non-empty list of snacks to evaluate (Snack or FallingSnack)
+
+        Returns:
+            The highest-scoring snack (the first one on ties)
+        """
+        evaluate = self.evaluate_snack
+        best = None
+        best_score = -math.inf
+        for snack in snacks:
+            score = evaluate(snack)
+            if score > best_score:
+                best_score = score
+                best = snack
+
+        return best
+
     def move_toward_target(self, dt: float) -> None:
         """Move toward the current target position."""
         if not self.target_position:
@@ -230,30 +296,33 @@ class AIPlayer(Player):
 
         dx = target_x - center_x
         dy = target_y - center_y if can_move_vertical else 0
-        distance = math.sqrt(dx * dx + dy * dy)
+        dist_sq = dx * dx + dy * dy
 
-        if distance < 5:
-            # Close enough
+        if dist_sq < 25.0:
+            # Close enough (within 5 pixels)
             self.velocity_x = 0
             self.velocity_y = 0
             self.is_moving = False
             return
 
         # Normalize direction
-        if distance > 0:
-            dx /= distance
-            dy /= distance
+        inv_len = 1.0 / _sqrt(dist_sq)
+        dx *= inv_len
+        dy *= inv_len
 
         # Apply pathfinding inefficiency (add some randomness)
-        if random.random() > self.pathfinding_efficiency:
-            dx += random.uniform(-0.3, 0.3)
+        if self._random() > self.pathfinding_efficiency:
+            noise_x, noise_y = self._noise_ring[self._noise_idx]
+            self._noise_idx = (self._noise_idx + 1) & (NOISE_RING_SIZE - 1)
+            dx += noise_x
             if can_move_vertical:
-                dy += random.uniform(-0.3, 0.3)
+                dy += noise_y
             # Re-normalize
-            length = math.sqrt(dx * dx + dy * dy)
-            if length > 0:
-                dx /= length
-                dy /= length
+            len_sq = dx * dx + dy * dy
+            if len_sq > 0:
+                inv_len = 1.0 / _sqrt(len_sq)
+                dx *= inv_len
+                dy *= inv_len
 
         # Apply chaos effect (flip controls)
         if self.controls_flipped:
@@ -261,7 +330,7 @@ class AIPlayer(Player):
             dy = -dy
 
         # Calculate speed
-        speed = self.base_move_speed * self.base_speed * self.get_speed_multiplier()
+        speed = self._speed_base * self._speed_mul
 
         self.velocity_x = dx * speed
         self.velocity_y = dy * speed if can_move_vertical else 0
@@ -284,3 +353,4 @@ class AIPlayer(Player):
         self.current_target = None
         self.target_position = None
         self.decision_timer = 0.0
+        self._kept_decisions = 0
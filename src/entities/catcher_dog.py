@@ -1,8 +1,10 @@
 """Catcher dog entity for Treat Attack game."""
 
 import pygame
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 from enum import Enum, auto
+from ..sprites.animation_controller import AnimationController
+from ..sprites.sprite_sheet_loader import AnimationState
 
 
 class LeashState(Enum):
@@ -15,6 +17,26 @@ class LeashState(Enum):
 class CatcherDog:
     """A dog that moves horizontally to catch falling treats."""
 
+    __slots__ = (
+        "character_id", "width", "height", "ground_y", "screen_width",
+        "x", "y", "_rect", "move_speed", "velocity_x", "facing_right", "is_moving",
+        "leash_anchor_x", "default_min_x", "default_max_x", "extended_max_x",
+        "yanked_max_x", "effect_duration", "_leash_anchor_pos", "_leash_sag_y",
+        "leash_state", "leash_effect_timer", "_min_x", "_max_x",
+        "_indicator_surfaces", "is_eating", "eat_timer", "eat_duration",
+        "_animation_controller",
+    )
+
+    # Leash line color for each leash state
+    LEASH_COLORS = {
+        LeashState.NORMAL: (139, 90, 43),     # Brown
+        LeashState.EXTENDED: (100, 200, 100),  # Green
+        LeashState.YANKED: (200, 100, 100),    # Red
+    }
+
+    # Size of the pre-rendered leash state indicator (centered on its middle pixel)
+    INDICATOR_SIZE = 17
+
     def __init__(self, config: Dict[str, Any], character_id: str = "jazzy"):
         """
         Initialize the catcher dog.
@@ -42,6 +64,9 @@ class CatcherDog:
         self.x = (default_min + default_max) / 2
         self.y = self.ground_y
 
+        # Collision rectangle, kept in step with the position in update()
+        self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
+
         # Movement
         self.move_speed = dog_config.get("move_speed", 300)
         self.velocity_x = 0
@@ -56,22 +81,34 @@ class CatcherDog:
         self.yanked_max_x = leash_config.get("yanked_max_x", 350)
         self.effect_duration = leash_config.get("effect_duration_seconds", 5.0)
 
+        # Leash line geometry (the dog only moves horizontally)
+        self._leash_anchor_pos = (int(self.leash_anchor_x), int(self.y + self.height / 2))
+        self._leash_sag_y = self._leash_anchor_pos[1] + 20  # Sag down a bit
+
         # Current leash state
         self.leash_state = LeashState.NORMAL
         self.leash_effect_timer = 0.0
 
+        # Movement limits for the current leash state (left edge of the dog)
+        self._min_x = 0.0
+        self._max_x = 0.0
+        self._update_leash_limits()
+
+        # Leash state indicators, drawn once and blitted above the dog
+        self._indicator_surfaces = self._create_indicator_surfaces()
+
         # Animation
         self.is_eating = False
         self.eat_timer = 0.0
         self.eat_duration = 0.4
 
-        # Animation controller (loaded lazily)
-        self._animation_controller = None
+        # Animation controller
+        self._animation_controller = AnimationController(character_id)
 
     @property
     def rect(self) -> pygame.Rect:
-        """Get the dog's collision rectangle."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """Get the dog's collision rectangle (shared; do not modify)."""
+        return self._rect
 
     @property
     def center(self) -> Tuple[float, float]:
@@ -92,11 +129,33 @@ class CatcherDog:
             return self.yanked_max_x
         return self.default_max_x
 
-    def _get_animation_controller(self):
-        """Lazily initialize animation controller."""
-        if self._animation_controller is None:
-            from ..sprites.animation_controller import AnimationController
-            self._animation_controller = AnimationController(self.character_id)
+    def _update_leash_limits(self) -> None:
+        """Recompute the movement limits after a leash state change."""
+        self._min_x = self.current_min_x
+        self._max_x = self.current_max_x - self.width
+
+    def _create_indicator_surfaces(self) -> Dict[LeashState, pygame.Surface]:
+        """Pre-render the leash state indicators shown above the dog."""
+        size = self.INDICATOR_SIZE
+        c = size // 2
+
+        # Green up arrow for extended
+        extended = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.polygon(extended, (100, 255, 100), [
+            (c, c - 5),
+            (c - 8, c + 5),
+            (c + 8, c + 5)
+        ])
+
+        # Red X for yanked
+        yanked = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.line(yanked, (255, 100, 100), (c - 6, c - 6), (c + 6, c + 6), 3)
+        pygame.draw.line(yanked, (255, 100, 100), (c + 6, c - 6), (c - 6, c + 6), 3)
+
+        return {LeashState.EXTENDED: extended, LeashState.YANKED: yanked}
+
+    def _get_animation_controller(self) -> AnimationController:
+        """Get the dog's animation controller."""
         return self._animation_controller
 
     def set_leash_state(self, state: LeashState) -> None:
@@ -107,6 +166,7 @@ class CatcherDog:
             state: New leash state
         """
         self.leash_state = state
+        self._update_leash_limits()
         if state != LeashState.NORMAL:
             self.leash_effect_timer = self.effect_duration
 
@@ -122,6 +182,7 @@ class CatcherDog:
         """Reset leash to normal state."""
         self.leash_state = LeashState.NORMAL
         self.leash_effect_timer = 0.0
+        self._update_leash_limits()
 
     def move_left(self) -> None:
         """Set movement direction to left."""
@@ -144,7 +205,7 @@ class CatcherDog:
         """Trigger the eat animation."""
         self.is_eating = True
         self.eat_timer = self.eat_duration
-        controller = self._get_animation_controller()
+        controller = self._animation_controller
         controller.trigger_eat_animation()
 
     def update(self, dt: float) -> None:
@@ -171,14 +232,19 @@ class CatcherDog:
             new_x = self.x + self.velocity_x * dt
 
             # Clamp to leash boundaries
-            min_x = self.current_min_x
-            max_x = self.current_max_x - self.width
+            if new_x > self._max_x:
+                new_x = self._max_x
+            if new_x < self._min_x:
+                new_x = self._min_x
 
-            self.x = max(min_x, min(new_x, max_x))
+            self.x = new_x
+            self._rect.x = int(new_x)
 
-        # Update animation
-        controller = self._get_animation_controller()
-        controller.update(dt, self.is_moving, self.facing_right)
+        # Update animation (nothing to advance while standing idle)
+        controller = self._animation_controller
+        if (self.is_moving or controller.state != AnimationState.IDLE
+                or controller.manual_override_state is not None):
+            controller.update(dt, self.is_moving, self.facing_right)
 
     def check_collision(self, treat_rect: pygame.Rect) -> bool:
         """
@@ -192,6 +258,18 @@ class CatcherDog:
         """
         return self.rect.colliderect(treat_rect)
 
+    def check_collisions(self, treat_rects: List[pygame.Rect]) -> List[int]:
+        """
+        Check the dog against many treats in a single call.
+
+        Args:
+            treat_rects: Treats' collision rectangles
+
+        Returns:
+            Indices into treat_rects of every treat the dog touches
+        """
+        return self._rect.collidelistall(treat_rects)
+
     def render(self, surface: pygame.Surface) -> None:
         """
         Render the dog.
@@ -199,7 +277,7 @@ class CatcherDog:
         Args:
             surface: Surface to render to
         """
-        controller = self._get_animation_controller()
+        controller = self._animation_controller
         frame = controller.get_current_sprite()
 
         if frame:
@@ -218,52 +296,31 @@ class CatcherDog:
 
     def _render_leash(self, surface: pygame.Surface) -> None:
         """Render the leash line from anchor to dog."""
-        anchor_pos = (self.leash_anchor_x, int(self.y + self.height / 2))
-        dog_pos = (int(self.x), int(self.y + self.height / 2))
+        anchor_pos = self._leash_anchor_pos
+        dog_x = int(self.x)
 
         # Leash color based on state
-        if self.leash_state == LeashState.EXTENDED:
-            color = (100, 200, 100)  # Green for extended
-        elif self.leash_state == LeashState.YANKED:
-            color = (200, 100, 100)  # Red for yanked
-        else:
-            color = (139, 90, 43)  # Brown for normal
+        color = self.LEASH_COLORS[self.leash_state]
 
         # Draw leash as a curved line (simple bezier approximation)
         # Using 3 line segments for a slight sag effect
-        mid_x = (anchor_pos[0] + dog_pos[0]) / 2
-        sag_y = anchor_pos[1] + 20  # Sag down a bit
+        mid_x = (anchor_pos[0] + dog_x) >> 1
+        sag_y = self._leash_sag_y
 
         pygame.draw.line(surface, color, anchor_pos, (mid_x, sag_y), 3)
-        pygame.draw.line(surface, color, (mid_x, sag_y), dog_pos, 3)
+        pygame.draw.line(surface, color, (mid_x, sag_y), (dog_x, anchor_pos[1]), 3)
 
     def _render_leash_indicator(self, surface: pygame.Surface) -> None:
         """Render leash state indicator above dog."""
-        if self.leash_state == LeashState.NORMAL:
+        indicator = self._indicator_surfaces.get(self.leash_state)
+        if indicator is None:
             return
 
         # Position above dog
         indicator_x = int(self.x + self.width / 2)
         indicator_y = int(self.y - 15)
-
-        # Draw indicator
-        if self.leash_state == LeashState.EXTENDED:
-            # Green up arrows
-            color = (100, 255, 100)
-            pygame.draw.polygon(surface, color, [
-                (indicator_x, indicator_y - 5),
-                (indicator_x - 8, indicator_y + 5),
-                (indicator_x + 8, indicator_y + 5)
-            ])
-        elif self.leash_state == LeashState.YANKED:
-            # Red X
-            color = (255, 100, 100)
-            pygame.draw.line(surface, color,
-                           (indicator_x - 6, indicator_y - 6),
-                           (indicator_x + 6, indicator_y + 6), 3)
-            pygame.draw.line(surface, color,
-                           (indicator_x + 6, indicator_y - 6),
-                           (indicator_x - 6, indicator_y + 6), 3)
+        half = self.INDICATOR_SIZE // 2
+        surface.blit(indicator, (indicator_x - half, indicator_y - half))
 
     def get_leash_effect_remaining(self) -> float:
         """Get remaining time on leash effect (0.0 to 1.0)."""
@@ -1,13 +1,29 @@
 """Falling treat entity for Treat Attack game."""
 
+import bisect
+import itertools
 import pygame
 import random
 from typing import Dict, Any, Tuple, Optional
+from ..sprites.sprite_sheet_loader import SpriteSheetLoader
 
 
 class FallingTreat:
     """A treat that falls from the top of the screen."""
 
+    __slots__ = (
+        "treat_id", "name", "point_value", "color", "spawn_bias_right",
+        "x", "y", "width", "height", "fall_speed", "screen_height",
+        "_rect", "active", "collected", "_sprite",
+    )
+
+    # Map treat types to food sprites
+    SPRITE_MAP = {
+        "normal": "pizza",
+        "power": "steak",
+        "bad": "broccoli"
+    }
+
     def __init__(self, treat_config: Dict[str, Any], x: float, screen_height: int,
                  fall_speed: float = 150):
         """
@@ -36,14 +52,22 @@ class FallingTreat:
         self.fall_speed = fall_speed
         self.screen_height = screen_height
 
+        # Collision rectangle, kept in step with the position in update()
+        self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
+
         # State
         self.active = True
         self.collected = False
 
+        # Food sprite, resolved once (None falls back to a colored rectangle)
+        self._sprite = SpriteSheetLoader().get_food_sprite(
+            self.SPRITE_MAP.get(self.treat_id, "pizza")
+        )
+
     @property
     def rect(self) -> pygame.Rect:
-        """Get the treat's collision rectangle."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """Get the treat's collision rectangle (shared; do not modify)."""
+        return self._rect
 
     @property
     def center(self) -> Tuple[float, float]:
@@ -65,6 +89,7 @@ class FallingTreat:
 
         # Fall down
         self.y += self.fall_speed * dt
+        self._rect.y = int(self.y)
 
         # Check if fell off screen
         if self.y > self.screen_height:
@@ -98,22 +123,8 @@ class FallingTreat:
         if not self.active:
             return
 
-        # Try to get PNG sprite first
-        from ..sprites.sprite_sheet_loader import SpriteSheetLoader
-        loader = SpriteSheetLoader()
-
-        # Map treat types to food sprites
-        sprite_map = {
-            "normal": "pizza",
-            "power": "steak",
-            "bad": "broccoli"
-        }
-
-        snack_id = sprite_map.get(self.treat_id, "pizza")
-        sprite = loader.get_food_sprite(snack_id)
-
-        if sprite:
-            surface.blit(sprite, (int(self.x), int(self.y)))
+        if self._sprite:
+            surface.blit(self._sprite, (int(self.x), int(self.y)))
         else:
             # Fallback to colored rectangle
             pygame.draw.rect(surface, self.color,
@@ -154,6 +165,18 @@ class TreatSpawner:
         self.fall_speed = 150
         self.margin = 50  # Margin from screen edges
 
+        # Running totals of spawn weights for weighted selection
+        self._cum_weights: list = []
+        self._total_weight = 0
+        self.invalidate_weights()
+
+    def invalidate_weights(self) -> None:
+        """Recompute cumulative spawn weights (call after changing treat_configs)."""
+        self._cum_weights = list(itertools.accumulate(
+            t.get("spawn_weight", 1) for t in self.treat_configs
+        ))
+        self._total_weight = self._cum_weights[-1] if self._cum_weights else 0
+
     def update(self, dt: float) -> Optional[FallingTreat]:
         """
         Update spawner and potentially spawn a new treat.
@@ -174,19 +197,10 @@ class TreatSpawner:
 
     def _spawn_treat(self) -> FallingTreat:
         """Spawn a new treat based on weighted random selection."""
-        # Calculate total weight
-        total_weight = sum(t.get("spawn_weight", 1) for t in self.treat_configs)
-
-        # Random selection
-        roll = random.uniform(0, total_weight)
-        cumulative = 0
-
-        selected_config = self.treat_configs[0]
-        for config in self.treat_configs:
-            cumulative += config.get("spawn_weight", 1)
-            if roll <= cumulative:
-                selected_config = config
-                break
+        # Random selection: first treat whose running weight reaches the roll
+        roll = random.uniform(0, self._total_weight)
+        idx = bisect.bisect_left(self._cum_weights, roll)
+        selected_config = self.treat_configs[idx]
 
         # Determine spawn X position
         if selected_config.get("spawn_bias_right", False):
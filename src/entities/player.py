@@ -2,17 +2,190 @@
 
 import pygame
 import math
-import time
+import random
 from typing import Dict, Any, Tuple, Optional, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..sprites.animation_controller import AnimationController
     from ..effects.powerup_vfx import PowerUpVFXManager
 
+_uniform = random.uniform
+_randint = random.randint
+
+
+# Tinted sprite variants: (id(source), tint) -> (source, tinted).
+# The source is kept so a recycled id can never match a different surface.
+_TINT_CACHE: Dict[Tuple[int, Tuple[int, int, int, int]], Tuple[pygame.Surface, pygame.Surface]] = {}
+TINT_CACHE_SIZE = 128
+
+
+def _tinted(sprite: pygame.Surface, tint: Tuple[int, int, int, int],
+            cache: bool = True) -> pygame.Surface:
+    """
+    Get a copy of a sprite with an additive RGB tint applied.
+
+    Args:
+        sprite: Source sprite (left unchanged)
+        tint: RGBA color added to every pixel (alpha is ignored)
+        cache: Reuse/store the result; pass False for one-off surfaces
+
+    Returns:
+        The tinted sprite
+    """
+    key = (id(sprite), tint)
+    if cache:
+        entry = _TINT_CACHE.get(key)
+        if entry is not None and entry[0] is sprite:
+            return entry[1]
+
+    # Use BLEND_RGB_ADD (not RGBA) to avoid alpha channel corruption on macOS
+    tinted = sprite.copy()
+    tinted.fill(tint, special_flags=pygame.BLEND_RGB_ADD)
+
+    if cache:
+        if len(_TINT_CACHE) >= TINT_CACHE_SIZE:
+            # Evict the oldest entry
+            del _TINT_CACHE[next(iter(_TINT_CACHE))]
+        _TINT_CACHE[key] = (sprite, tinted)
+    return tinted
+
+
+# Faded particle sprites, keyed by size and alpha (quantized to ALPHA_STEP):
+# (id(source), size, alpha) -> (source, faded). Speed lines use id 0 and
+# drawn steam puffs id(None), both with a None source.
+_PARTICLE_CACHE: Dict[Tuple[int, int, int], Tuple[Optional[pygame.Surface], pygame.Surface]] = {}
+PARTICLE_CACHE_SIZE = 1024
+ALPHA_STEP = 8
+
+
+def _quantize_alpha(alpha: int) -> int:
+    """Round an alpha value to the nearest cached level."""
+    return min(255, (alpha + ALPHA_STEP // 2) // ALPHA_STEP * ALPHA_STEP)
+
+
+def _cache_particle(key: Tuple[int, int, int], source: Optional[pygame.Surface],
+                    surf: pygame.Surface) -> pygame.Surface:
+    """Store a particle sprite in the cache, evicting the oldest entry when full."""
+    if len(_PARTICLE_CACHE) >= PARTICLE_CACHE_SIZE:
+        del _PARTICLE_CACHE[next(iter(_PARTICLE_CACHE))]
+    _PARTICLE_CACHE[key] = (source, surf)
+    return surf
+
+
+def _speed_line_surface(length: int, alpha: int) -> pygame.Surface:
+    """Get a speed line of the given length and (quantized) alpha."""
+    key = (0, length, alpha)
+    entry = _PARTICLE_CACHE.get(key)
+    if entry is not None:
+        return entry[1]
+    line_surface = pygame.Surface((length, 4), pygame.SRCALPHA)
+    pygame.draw.line(line_surface, (100, 200, 255, alpha), (0, 2), (length, 2), 3)
+    return _cache_particle(key, None, line_surface)
+
+
+def _steam_surface(steam_sprite: Optional[pygame.Surface], size: int,
+                   alpha: int) -> pygame.Surface:
+    """
+    Get a steam puff of the given radius and (quantized) alpha.
+
+    Args:
+        steam_sprite: Steam sprite to scale, or None to draw a circle
+        size: Puff radius in pixels
+        alpha: Puff opacity
+
+    Returns:
+        A (size * 2) square surface
+    """
+    key = (id(steam_sprite), size, alpha)
+    entry = _PARTICLE_CACHE.get(key)
+    if entry is not None and entry[0] is steam_sprite:
+        return entry[1]
+
+    if steam_sprite:
+        sprite_size = size * 2
+        faded_steam = pygame.transform.scale(steam_sprite, (sprite_size, sprite_size))
+        # Use BLEND_RGBA_MULT for reliable alpha fading on macOS SDL2 Metal
+        fade_mask = pygame.Surface(faded_steam.get_size(), pygame.SRCALPHA)
+        fade_mask.fill((255, 255, 255, alpha))
+        faded_steam.blit(fade_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    else:
+        # Steam puff (white/gray circle with transparency) fallback
+        faded_steam = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(faded_steam, (255, 255, 255, alpha), (size, size), size)
+    return _cache_particle(key, steam_sprite, faded_steam)
+
+
+# Invincibility flash phase (0 = flash on), toggled at 10 Hz by begin_frame()
+_flash_phase = 0
+
+
+def begin_frame(now: float) -> None:
+    """
+    Latch per-frame render state shared by every player; call once per tick.
+
+    Args:
+        now: Current wall-clock time in seconds (e.g. time.time())
+    """
+    global _flash_phase
+    _flash_phase = int(now * 10) & 1
+
+
+# Field indices of a steam particle: [x, y, vx, vy, life, size]
+_STEAM_X, _STEAM_Y, _STEAM_VX, _STEAM_VY, _STEAM_LIFE, _STEAM_SIZE = range(6)
+
+# Field indices of a speed line: [x, y, length, life, facing_right]
+_LINE_X, _LINE_Y, _LINE_LENGTH, _LINE_LIFE, _LINE_FACING_RIGHT = range(5)
+
+# Per-axis component of a normalized diagonal (1/sqrt(2))
+_DIAG = math.sqrt(0.5)
+
+# Held-key bits for the direction lookup table
+_KEY_UP = 1
+_KEY_DOWN = 2
+_KEY_LEFT = 4
+_KEY_RIGHT = 8
+
+
+def _build_direction_table() -> Tuple[Tuple[float, float], ...]:
+    """Map every combination of held direction keys to a movement (dx, dy)."""
+    table = []
+    for mask in range(16):
+        # Down wins over up and right over left when both are held
+        dy = 1 if mask & _KEY_DOWN else (-1 if mask & _KEY_UP else 0)
+        dx = 1 if mask & _KEY_RIGHT else (-1 if mask & _KEY_LEFT else 0)
+        # Normalize diagonal movement
+        if dx != 0 and dy != 0:
+            dx *= _DIAG
+            dy *= _DIAG
+        table.append((dx, dy))
+    return tuple(table)
+
+
+_DIRECTION_TABLE = _build_direction_table()
+
 
 class Player:
     """A player-controlled dog character."""
 
+    __slots__ = (
+        "character_id", "name", "base_speed", "color", "width", "height",
+        "arena_bounds", "player_num", "horizontal_only",
+        "x", "y", "_rect", "_resting_y", "_min_y", "_max_y",
+        "base_move_speed", "_speed_base", "velocity_x", "velocity_y", "score",
+        "active_effects", "is_invincible", "controls_flipped",
+        "_speed_mul", "_score_mul", "_has_slow", "_has_chaos", "_has_boost",
+        "leash_base_min_x", "leash_base_max_x", "leash_min_x", "leash_max_x",
+        "leash_effect_timer", "leash_effect_duration",
+        "leash_extend_amount", "leash_yank_amount", "_leash_state",
+        "facing_right", "is_moving", "_animation_controller",
+        "steam_particles", "speed_lines", "_vfx_manager",
+        "_flight_hover_offset", "_flight_lift_offset", "_flight_tilt_angle",
+        "_flight_time", "_composed_key", "_composed_sprite",
+    )
+
+    # How far up the dog can fly as a fraction of ground‑to‑top distance
+    FLIGHT_HEIGHT_FRACTION = 0.35
+
     def __init__(self, character_config: Dict[str, Any], arena_bounds: pygame.Rect,
                  player_num: int = 1, horizontal_only: bool = False):
         """
@@ -45,15 +218,17 @@ class Player:
         self.x = arena_bounds.centerx - self.width // 2
         self.y = arena_bounds.centery - self.height // 2
 
+        # Collision rectangle, reused by the rect property
+        self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
+
         # Resting Y position — used to return to ground after flight ends
         # (updated by gameplay screen when positioning on ground level)
         self._resting_y = self.y
 
-        # How far up the dog can fly as a fraction of ground‑to‑top distance
-        self.FLIGHT_HEIGHT_FRACTION = 0.35
-
         # Movement - faster for larger screen
         self.base_move_speed = 350  # pixels per second
+        # Unboosted speed; recompute if base_move_speed or base_speed changes
+        self._speed_base = self.base_move_speed * self.base_speed
         self.velocity_x = 0
         self.velocity_y = 0
 
@@ -63,6 +238,13 @@ class Player:
         self.is_invincible = False
         self.controls_flipped = False
 
+        # Summary of active_effects, refreshed whenever an effect is added or expires
+        self._speed_mul = 1.0
+        self._score_mul = 1.0
+        self._has_slow = False
+        self._has_chaos = False
+        self._has_boost = False
+
         # Leash system - controls horizontal movement boundaries
         self.leash_base_min_x = arena_bounds.left
         self.leash_base_max_x = arena_bounds.right - self.width
@@ -74,6 +256,7 @@ class Player:
         arena_width = arena_bounds.width
         self.leash_extend_amount = int(arena_width * 0.15)  # Extend 15% more
         self.leash_yank_amount = int(arena_width * 0.35)  # Restrict by 35% (very noticeable!)
+        self._leash_state = "normal"  # Cached for get_leash_state()
 
         # Animation state - player 1 faces right, player 2 faces left
         self.facing_right = (player_num == 1)
@@ -83,10 +266,10 @@ class Player:
         self._animation_controller: Optional['AnimationController'] = None
 
         # Steam particles for chaos/chilli effect
-        self.steam_particles: List[Dict[str, float]] = []
+        self.steam_particles: List[List[float]] = []
 
         # Speed lines for boost effect (legacy — kept for compatibility)
-        self.speed_lines: List[Dict[str, float]] = []
+        self.speed_lines: List[List[Any]] = []
 
         # Power-up visual effects manager (lazy initialization)
         self._vfx_manager: Optional['PowerUpVFXManager'] = None
@@ -97,10 +280,26 @@ class Player:
         self._flight_tilt_angle = 0.0     # Head-tilt rotation in degrees
         self._flight_time = 0.0           # Elapsed time for sinusoidal bob
 
+        # Last rotated/tinted sprite, reused while (source, tilt, tint) is unchanged
+        self._composed_key: Optional[Tuple[Any, float, Any]] = None
+        self._composed_sprite: Optional[pygame.Surface] = None
+
+        # Position limits within the arena (top-left corner)
+        self._cache_bounds()
+
+    def _cache_bounds(self) -> None:
+        """Recompute the vertical position limits; call again if arena_bounds changes."""
+        self._min_y = self.arena_bounds.top
+        self._max_y = self.arena_bounds.bottom - self.height
+
     @property
     def rect(self) -> pygame.Rect:
-        """Get the player's collision rectangle."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """Get the player's collision rectangle (shared; do not modify)."""
+        # Synced on access since screens also reposition the player directly
+        rect = self._rect
+        rect.x = int(self.x)
+        rect.y = int(self.y)
+        return rect
 
     @property
     def center(self) -> Tuple[float, float]:
@@ -129,25 +328,39 @@ class Player:
         """Trigger the eat/attack animation when collecting a snack."""
         self.animation_controller.trigger_eat_animation()
 
-    def get_speed_multiplier(self) -> float:
-        """Calculate current speed multiplier from active effects."""
-        multiplier = 1.0
+    def _refresh_effect_summary(self) -> None:
+        """Recompute the cached multipliers and flags from active_effects."""
+        speed_mul = 1.0
+        score_mul = 1.0
+        has_slow = has_chaos = has_boost = False
         for effect in self.active_effects:
-            if effect["type"] in ("speed_boost", "slow", "boost"):
-                multiplier *= effect["magnitude"]
-        return multiplier
+            effect_type = effect["type"]
+            if effect_type in ("speed_boost", "slow", "boost"):
+                speed_mul *= effect["magnitude"]
+            if effect_type == "boost":
+                score_mul *= effect["magnitude"]
+                has_boost = True
+            elif effect_type == "slow":
+                has_slow = True
+            elif effect_type == "chaos":
+                has_chaos = True
+        self._speed_mul = speed_mul
+        self._score_mul = score_mul
+        self._has_slow = has_slow
+        self._has_chaos = has_chaos
+        self._has_boost = has_boost
+
+    def get_speed_multiplier(self) -> float:
+        """Get current speed multiplier from active effects."""
+        return self._speed_mul
 
     def get_score_multiplier(self) -> float:
-        """Calculate current score multiplier from active effects (boost mode)."""
-        multiplier = 1.0
-        for effect in self.active_effects:
-            if effect["type"] == "boost":
-                multiplier *= effect["magnitude"]
-        return multiplier
+        """Get current score multiplier from active effects (boost mode)."""
+        return self._score_mul
 
     def has_boost_effect(self) -> bool:
         """Check if player has boost effect active."""
-        return any(e["type"] == "boost" for e in self.active_effects)
+        return self._has_boost
 
     def get_flight_ceiling(self) -> float:
         """Return the highest Y the dog may reach while flying.
@@ -197,6 +410,7 @@ class Player:
             "time_remaining": duration
         }
         self.active_effects.append(effect)
+        self._refresh_effect_summary()
 
         if effect_type == "invincibility":
             self.is_invincible = True
@@ -215,9 +429,12 @@ class Player:
             List of expired effects
         """
         expired = []
-        still_active = []
 
-        for effect in self.active_effects:
+        # Compact the list in place, keeping the order the status
+        # indicators are stacked in
+        effects = self.active_effects
+        kept = 0
+        for effect in effects:
             effect["time_remaining"] -= dt
             if effect["time_remaining"] <= 0:
                 expired.append(effect)
@@ -227,9 +444,12 @@ class Player:
                 elif effect["type"] == "chaos":
                     self.controls_flipped = False
             else:
-                still_active.append(effect)
+                effects[kept] = effect
+                kept += 1
 
-        self.active_effects = still_active
+        if expired:
+            del effects[kept:]
+            self._refresh_effect_summary()
         return expired
 
     def handle_input(self, keys_pressed: Dict[str, bool]) -> None:
@@ -239,35 +459,30 @@ class Player:
         Args:
             keys_pressed: Dictionary of control keys to their pressed state
         """
-        dx = 0
-        dy = 0
-
         # Free-flight: allow vertical movement when boost is active,
         # even in horizontal_only mode
         can_move_vertical = not self.horizontal_only or self.has_boost_effect()
 
+        mask = 0
+        if keys_pressed.get("left", False):
+            mask |= _KEY_LEFT
+        if keys_pressed.get("right", False):
+            mask |= _KEY_RIGHT
         if can_move_vertical:
             if keys_pressed.get("up", False):
-                dy = -1
+                mask |= _KEY_UP
             if keys_pressed.get("down", False):
-                dy = 1
+                mask |= _KEY_DOWN
 
-        if keys_pressed.get("left", False):
-            dx = -1
-        if keys_pressed.get("right", False):
-            dx = 1
+        # Direction with diagonals already normalized
+        dx, dy = _DIRECTION_TABLE[mask]
 
         # Apply chaos effect (flip controls)
         if self.controls_flipped:
             dx = -dx
             dy = -dy
 
-        # Normalize diagonal movement (only if vertical movement is allowed)
-        if can_move_vertical and dx != 0 and dy != 0:
-            dx *= 0.707  # 1/sqrt(2)
-            dy *= 0.707
-
-        speed = self.base_move_speed * self.base_speed * self.get_speed_multiplier()
+        speed = self._speed_base * self._speed_mul
         self.velocity_x = dx * speed
         self.velocity_y = dy * speed if can_move_vertical else 0
 
@@ -310,13 +525,20 @@ class Player:
         new_x = self.x + self.velocity_x * dt
         new_y = self.y + self.velocity_y * dt
 
-        # Clamp to leash bounds (horizontal) and arena bounds (vertical)
-        new_x = max(self.leash_min_x, min(new_x, self.leash_max_x))
+        # Clamp to leash bounds (horizontal) and arena bounds (vertical);
+        # the lower limit wins if the limits ever cross
+        if new_x > self.leash_max_x:
+            new_x = self.leash_max_x
+        if new_x < self.leash_min_x:
+            new_x = self.leash_min_x
         # Use flight ceiling instead of full arena top when boosting
-        min_y = self.arena_bounds.top
+        min_y = self._min_y
         if self.horizontal_only and self.has_boost_effect():
             min_y = self.get_flight_ceiling()
-        new_y = max(min_y, min(new_y, self.arena_bounds.bottom - self.height))
+        if new_y > self._max_y:
+            new_y = self._max_y
+        if new_y < min_y:
+            new_y = min_y
 
         self.x = new_x
         self.y = new_y
@@ -330,8 +552,12 @@ class Player:
         # Update free-flight visuals (hover bob, lift, tilt)
         self._update_flight_state(dt)
 
-        # Update steam particles
-        self._update_steam_particles(dt)
+        # Update steam particles (chaos) and speed lines (boost); both are
+        # skipped once the effect has ended and its particles have faded
+        if self._has_chaos or self.steam_particles:
+            self._update_steam_particles(dt)
+        if self._has_boost or self.speed_lines:
+            self._update_speed_lines(dt)
 
         # Update power-up VFX
         self.vfx.update(
@@ -353,6 +579,7 @@ class Player:
         else:
             self.leash_max_x = self.leash_base_max_x + self.leash_extend_amount
         self.leash_effect_timer = self.leash_effect_duration
+        self._update_leash_state()
 
     def yank_leash(self) -> None:
         """Yank the leash, restricting movement range."""
@@ -363,12 +590,25 @@ class Player:
             self.leash_min_x + min_range
         )
         self.leash_effect_timer = self.leash_effect_duration
+        self._update_leash_state()
 
     def reset_leash(self) -> None:
         """Reset leash to default boundaries."""
         self.leash_min_x = self.leash_base_min_x
         self.leash_max_x = self.leash_base_max_x
         self.leash_effect_timer = 0.0
+        self._leash_state = "normal"
+
+    def _update_leash_state(self) -> None:
+        """Recompute the cached leash state after the leash limits change."""
+        if self.leash_effect_timer <= 0:
+            self._leash_state = "normal"
+        elif self.leash_max_x > self.leash_base_max_x:
+            self._leash_state = "extended"
+        elif self.leash_max_x < self.leash_base_max_x:
+            self._leash_state = "yanked"
+        else:
+            self._leash_state = "normal"
 
     # ------------------------------------------------------------------
     # Free-flight helpers (active during boost / Red Bull)
@@ -405,13 +645,7 @@ class Player:
 
     def get_leash_state(self) -> str:
         """Get current leash state for visual feedback."""
-        if self.leash_effect_timer <= 0:
-            return "normal"
-        elif self.leash_max_x > self.leash_base_max_x:
-            return "extended"
-        elif self.leash_max_x < self.leash_base_max_x:
-            return "yanked"
-        return "normal"
+        return self._leash_state
 
     def add_score(self, points: int) -> None:
         """Add points to the player's score."""
@@ -432,6 +666,7 @@ class Player:
         self.reset_position()
         self.score = 0
         self.active_effects.clear()
+        self._refresh_effect_summary()
         self.is_invincible = False
         self.controls_flipped = False
         self.reset_leash()
@@ -453,73 +688,73 @@ class Player:
 
     def _update_steam_particles(self, dt: float) -> None:
         """Update steam particles for chaos/chilli effect."""
-        import random
-
-        # Check if chaos effect is active
-        has_chaos_effect = any(e["type"] == "chaos" for e in self.active_effects)
-
         # Spawn new steam particles if chaos effect active
-        if has_chaos_effect:
+        if self._has_chaos:
             # Spawn 2-3 particles per frame
-            for _ in range(random.randint(2, 3)):
-                self.steam_particles.append({
-                    "x": self.x + self.width // 2 + random.uniform(-20, 20),
-                    "y": self.y + 10,
-                    "vx": random.uniform(-15, 15),
-                    "vy": random.uniform(-60, -40),
-                    "life": 0.8,
-                    "size": random.uniform(6, 12)
-                })
-
-        # Update existing particles
-        for p in self.steam_particles:
-            p["x"] += p["vx"] * dt
-            p["y"] += p["vy"] * dt
-            p["life"] -= dt
-            p["size"] += 8 * dt  # Grow as they rise
-
-        # Remove dead particles
-        self.steam_particles = [p for p in self.steam_particles if p["life"] > 0]
-
-        # Update speed lines for boost effect
-        self._update_speed_lines(dt)
+            for _ in range(_randint(2, 3)):
+                self.steam_particles.append([
+                    self.x + self.width // 2 + _uniform(-20, 20),  # x
+                    self.y + 10,                                   # y
+                    _uniform(-15, 15),                             # vx
+                    _uniform(-60, -40),                            # vy
+                    0.8,                                           # life
+                    _uniform(6, 12)                                # size
+                ])
+
+        # Update existing particles, dropping dead ones in place
+        # (swap with the last particle and pop; draw order doesn't matter)
+        particles = self.steam_particles
+        grow = 8 * dt  # Grow as they rise
+        i = 0
+        while i < len(particles):
+            p = particles[i]
+            p[_STEAM_LIFE] -= dt
+            if p[_STEAM_LIFE] <= 0:
+                particles[i] = particles[-1]
+                particles.pop()
+                continue
+            p[_STEAM_X] += p[_STEAM_VX] * dt
+            p[_STEAM_Y] += p[_STEAM_VY] * dt
+            p[_STEAM_SIZE] += grow
+            i += 1
 
     def _update_speed_lines(self, dt: float) -> None:
         """Update speed lines for boost effect."""
-        import random
-
-        # Check if boost effect is active
-        has_boost = self.has_boost_effect()
-
         # Spawn new speed lines if boost active
-        if has_boost:
+        if self._has_boost:
             # Spawn 1-2 lines per frame
-            for _ in range(random.randint(1, 2)):
+            for _ in range(_randint(1, 2)):
                 # Lines spawn behind the dog based on facing direction
                 if self.facing_right:
                     start_x = self.x - 10
                 else:
                     start_x = self.x + self.width + 10
 
-                self.speed_lines.append({
-                    "x": start_x,
-                    "y": self.y + random.uniform(20, self.height - 20),
-                    "length": random.uniform(30, 60),
-                    "life": 0.3,
-                    "facing_right": self.facing_right
-                })
-
-        # Update existing speed lines
-        for line in self.speed_lines:
-            line["life"] -= dt
+                self.speed_lines.append([
+                    start_x,                                  # x
+                    self.y + _uniform(20, self.height - 20),  # y
+                    _uniform(30, 60),                         # length
+                    0.3,                                      # life
+                    self.facing_right                         # facing_right
+                ])
+
+        # Update existing speed lines, dropping dead ones in place
+        lines = self.speed_lines
+        step = 400 * dt
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            line[_LINE_LIFE] -= dt
+            if line[_LINE_LIFE] <= 0:
+                lines[i] = lines[-1]
+                lines.pop()
+                continue
             # Lines move opposite to facing direction
-            if line["facing_right"]:
-                line["x"] -= 400 * dt
+            if line[_LINE_FACING_RIGHT]:
+                line[_LINE_X] -= step
             else:
-                line["x"] += 400 * dt
-
-        # Remove dead lines
-        self.speed_lines = [l for l in self.speed_lines if l["life"] > 0]
+                line[_LINE_X] += step
+            i += 1
 
     def render(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0)) -> None:
         """
@@ -529,8 +764,13 @@ class Player:
             surface: Surface to render to
             offset: Offset for rendering within arena
         """
-        render_x = int(self.x - self.arena_bounds.left + offset[0])
-        render_y = int(self.y - self.arena_bounds.top + offset[1])
+        arena_left = self.arena_bounds.left
+        arena_top = self.arena_bounds.top
+        # Arena-to-surface translation, shared by the sprite and its particles
+        origin_x = offset[0] - arena_left
+        origin_y = offset[1] - arena_top
+        render_x = int(self.x + origin_x)
+        render_y = int(self.y + origin_y)
 
         # Apply free-flight visual offsets (hover bob + lift)
         flight_y_offset = int(self._flight_lift_offset + self._flight_hover_offset)
@@ -558,60 +798,74 @@ class Player:
         elif boost_sprite_override is not None:
             sprite = boost_sprite_override
 
-        # Apply head-tilt rotation during free-flight
+        # Head-tilt rotation during free-flight, in quarter degrees so a
+        # settled tilt keeps reusing the same composed sprite
+        tilt = 0.0
         if front_flight_override is None and abs(self._flight_tilt_angle) > 0.5:
-            rotated = pygame.transform.rotate(sprite, self._flight_tilt_angle)
-            # Re-centre after rotation (rotation expands bounding box)
-            old_center = sprite.get_rect(topleft=(render_x, render_y)).center
-            new_rect = rotated.get_rect(center=old_center)
-            render_x, render_y = new_rect.topleft
-            sprite = rotated
+            tilt = round(self._flight_tilt_angle * 4) / 4
+
+        # Effect tints are additive and saturate per channel, so they are
+        # summed and applied to the sprite in a single pass
+        tint_r = tint_g = tint_b = 0
 
-        # Handle invincibility flashing
-        if self.is_invincible:
-            if int(time.time() * 10) % 2 == 0:
-                # Create a white-tinted version
-                # Use BLEND_RGB_ADD (not RGBA) to avoid alpha channel corruption on macOS
-                flash_sprite = sprite.copy()
-                flash_sprite.fill((255, 255, 255, 0), special_flags=pygame.BLEND_RGB_ADD)
-                sprite = flash_sprite
+        # Handle invincibility flashing - white
+        if self.is_invincible and _flash_phase == 0:
+            tint_r = tint_g = tint_b = 255
 
         # Handle slow effect (broccoli) - turn green
-        has_slow_effect = any(e["type"] == "slow" for e in self.active_effects)
-        if has_slow_effect:
-            green_sprite = sprite.copy()
-            green_sprite.fill((0, 150, 0, 0), special_flags=pygame.BLEND_RGB_ADD)
-            sprite = green_sprite
+        if self._has_slow:
+            tint_g += 150
 
         # Handle chaos effect (chilli) - turn red
-        has_chaos_effect = any(e["type"] == "chaos" for e in self.active_effects)
-        if has_chaos_effect:
-            red_sprite = sprite.copy()
-            red_sprite.fill((150, 0, 0, 0), special_flags=pygame.BLEND_RGB_ADD)
-            sprite = red_sprite
+        if self._has_chaos:
+            tint_r += 150
 
         # Handle boost effect (red bull) - add blue tint
         if self.has_boost_effect() and not using_boost_sheet:
-            blue_sprite = sprite.copy()
-            blue_sprite.fill((0, 50, 150, 0), special_flags=pygame.BLEND_RGB_ADD)
-            sprite = blue_sprite
+            tint_g += 50
+            tint_b += 150
 
-        # Draw speed lines BEHIND the sprite (legacy simple lines)
-        for line in self.speed_lines:
-            line_x = int(line["x"] - self.arena_bounds.left + offset[0])
-            line_y = int(line["y"] - self.arena_bounds.top + offset[1])
-            alpha = int(255 * (line["life"] / 0.3))
-            length = int(line["length"])
+        tint = None
+        if tint_r or tint_g or tint_b:
+            tint = (min(tint_r, 255), min(tint_g, 255), min(tint_b, 255), 0)
+
+        # Only rotate and tint again when the frame, tilt or tint changed
+        composed_key = (sprite, tilt, tint)
+        if composed_key == self._composed_key:
+            composed = self._composed_sprite
+        else:
+            composed = sprite
+            if tilt:
+                composed = pygame.transform.rotate(sprite, tilt)
+            if tint:
+                # Rotated sprites are owned by this player, not the shared cache
+                composed = _tinted(composed, tint, cache=not tilt)
+            self._composed_key = composed_key
+            self._composed_sprite = composed
+
+        if tilt:
+            # Re-centre after rotation (rotation expands bounding box)
+            old_center = sprite.get_rect(topleft=(render_x, render_y)).center
+            new_rect = composed.get_rect(center=old_center)
+            render_x, render_y = new_rect.topleft
+        sprite = composed
 
-            line_surface = pygame.Surface((length, 4), pygame.SRCALPHA)
-            pygame.draw.line(line_surface, (100, 200, 255, alpha), (0, 2), (length, 2), 3)
-            surface.blit(line_surface, (line_x, line_y - 2))
+        # Draw speed lines BEHIND the sprite (legacy simple lines)
+        if self.speed_lines:
+            line_blits = []
+            for line in self.speed_lines:
+                line_x = int(line[_LINE_X] + origin_x)
+                line_y = int(line[_LINE_Y] + origin_y)
+                alpha = _quantize_alpha(int(255 * (line[_LINE_LIFE] / 0.3)))
+                line_surface = _speed_line_surface(int(line[_LINE_LENGTH]), alpha)
+                line_blits.append((line_surface, (line_x, line_y - 2)))
+            surface.blits(line_blits, doreturn=False)
 
         # --- Power-up VFX: behind-sprite pass (aura, wings, afterimages) ---
         self.vfx.render_behind(
             surface, sprite, render_x, render_y,
             self.width, self.height, self.active_effects,
-            self.arena_bounds.left, self.arena_bounds.top, offset,
+            arena_left, arena_top, offset,
             facing_right=self.facing_right,
             render_wings=not using_boost_sheet,
             is_flying=self.has_boost_effect()
@@ -624,33 +878,25 @@ class Player:
         self.vfx.render_front(
             surface, render_x, render_y,
             self.width, self.height, self.active_effects,
-            self.arena_bounds.left, self.arena_bounds.top, offset,
+            arena_left, arena_top, offset,
             facing_right=self.facing_right,
             render_wings=not using_boost_sheet
         )
 
         # Draw steam particles (for chaos/chilli effect)
+        if not self.steam_particles:
+            return
+
         from ..sprites.sprite_sheet_loader import SpriteSheetLoader
         steam_sprite = SpriteSheetLoader().get_steam_sprite()
-        
+
+        steam_blits = []
         for p in self.steam_particles:
-            particle_x = int(p["x"] - self.arena_bounds.left + offset[0])
-            particle_y = int(p["y"] - self.arena_bounds.top + offset[1])
-            alpha = int(255 * (p["life"] / 0.8))
-            size = int(p["size"])
-
-            if steam_sprite:
-                # Use sprite
-                sprite_size = size * 2
-                scaled_steam = pygame.transform.scale(steam_sprite, (sprite_size, sprite_size))
-                # Use BLEND_RGBA_MULT for reliable alpha fading on macOS SDL2 Metal
-                faded_steam = scaled_steam.copy()
-                fade_mask = pygame.Surface(faded_steam.get_size(), pygame.SRCALPHA)
-                fade_mask.fill((255, 255, 255, alpha))
-                faded_steam.blit(fade_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                surface.blit(faded_steam, (particle_x - size, particle_y - size))
-            else:
-                # Draw steam puff (white/gray circle with transparency) fallback
-                steam_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(steam_surface, (255, 255, 255, alpha), (size, size), size)
-                surface.blit(steam_surface, (particle_x - size, particle_y - size))
+            particle_x = int(p[_STEAM_X] + origin_x)
+            particle_y = int(p[_STEAM_Y] + origin_y)
+            alpha = _quantize_alpha(int(255 * (p[_STEAM_LIFE] / 0.8)))
+            size = int(p[_STEAM_SIZE])
+
+            steam_surface = _steam_surface(steam_sprite, size, alpha)
+            steam_blits.append((steam_surface, (particle_x - size, particle_y - size)))
+        surface.blits(steam_blits, doreturn=False)
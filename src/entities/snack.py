@@ -1,8 +1,68 @@
 """Snack entity - collectible items in the game."""
 
 import pygame
+import math
+import time
+from collections import namedtuple
 from typing import Dict, Any, Tuple, Optional
 
+_sin = math.sin
+_time = time.time
+
+
+# A snack's power-up or penalty effect, built once from its config
+EffectDesc = namedtuple("EffectDesc", "kind magnitude duration")
+
+# Effect codes for quick table lookups (e.g. AI snack scoring)
+EFFECT_NONE = 0
+EFFECT_SPEED_BOOST = 1
+EFFECT_INVINCIBILITY = 2
+
+_EFFECT_CODES = {
+    "speed_boost": EFFECT_SPEED_BOOST,
+    "invincibility": EFFECT_INVINCIBILITY,
+}
+
+
+# Half-transparent sprite variants for the despawn flash: id(source) -> (source, faded).
+# The source is kept so a recycled id can never match a different surface.
+_FADED_CACHE: Dict[int, Tuple[pygame.Surface, pygame.Surface]] = {}
+
+
+def _faded(sprite: pygame.Surface) -> pygame.Surface:
+    """Get a cached copy of a sprite at half its alpha."""
+    entry = _FADED_CACHE.get(id(sprite))
+    if entry is not None and entry[0] is sprite:
+        return entry[1]
+
+    # Make sprite semi-transparent by creating a copy
+    # Using set_alpha on a convert_alpha() copy is safe, but we use
+    # fill+BLEND_RGBA_MULT as a more reliable cross-platform approach
+    faded = sprite.copy()
+    alpha_surface = pygame.Surface(faded.get_size(), pygame.SRCALPHA)
+    alpha_surface.fill((255, 255, 255, 128))
+    faded.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    _FADED_CACHE[id(sprite)] = (sprite, faded)
+    return faded
+
+
+def make_effect(effect_config: Optional[Dict[str, Any]]) -> Optional[EffectDesc]:
+    """Build an EffectDesc from a snack's effect config (None if it has no effect)."""
+    if not effect_config:
+        return None
+    return EffectDesc(
+        effect_config["type"],
+        effect_config["magnitude"],
+        effect_config["duration_seconds"]
+    )
+
+
+def effect_code(effect: Optional[EffectDesc]) -> int:
+    """Map a snack's effect to its EFFECT_* code."""
+    if effect is None:
+        return EFFECT_NONE
+    return _EFFECT_CODES.get(effect.kind, EFFECT_NONE)
+
 
 class Snack:
     """A collectible snack item."""
@@ -31,7 +91,8 @@ class Snack:
                 pass
         
         self.point_value = snack_config.get("point_value", 0)
-        self.effect = snack_config.get("effect")
+        self.effect = make_effect(snack_config.get("effect"))
+        self.effect_code = effect_code(self.effect)
         self.despawn_time = snack_config.get("despawn_seconds", 8.0)
         self.color = tuple(snack_config.get("color", [255, 255, 255]))
         size = snack_config.get("size", [16, 16])
@@ -40,6 +101,8 @@ class Snack:
 
         self.arena_bounds = arena_bounds
         self.x, self.y = position
+        # Collision rectangle, reused by the rect property
+        self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.active = True
         self.time_alive = 0.0
 
@@ -47,10 +110,20 @@ class Snack:
         self.bob_offset = 0.0
         self.bob_speed = 3.0
 
+        # Sprite, resolved once: PNG food sprite first, procedural fallback
+        from ..sprites.sprite_sheet_loader import SpriteSheetLoader
+        from ..sprites.pixel_art import SpriteCache
+        self._sprite = SpriteSheetLoader().get_food_sprite(self.snack_id)
+        if self._sprite is None:
+            self._sprite = SpriteCache().get_snack_sprite(self.snack_id)
+
     @property
     def rect(self) -> pygame.Rect:
-        """Get the snack's collision rectangle."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """Get the snack's collision rectangle (shared; do not modify)."""
+        rect = self._rect
+        rect.x = int(self.x)
+        rect.y = int(self.y)
+        return rect
 
     @property
     def center(self) -> Tuple[float, float]:
@@ -78,8 +151,7 @@ class Snack:
             return False
 
         # Update bob animation
-        import math
-        self.bob_offset = math.sin(self.time_alive * self.bob_speed) * 3
+        self.bob_offset = _sin(self.time_alive * self.bob_speed) * 3
 
         return True
 
@@ -117,33 +189,16 @@ class Snack:
         if not self.active:
             return
 
-        from ..sprites.sprite_sheet_loader import SpriteSheetLoader
-        from ..sprites.pixel_art import SpriteCache
-
-        render_x = int(self.x - self.arena_bounds.left + offset[0])
-        render_y = int(self.y - self.arena_bounds.top + offset[1] + self.bob_offset)
-
-        # Try to get PNG food sprite first
-        loader = SpriteSheetLoader()
-        sprite = loader.get_food_sprite(self.snack_id)
-
-        # Fall back to procedural sprite if PNG not available
-        if sprite is None:
-            cache = SpriteCache()
-            sprite = cache.get_snack_sprite(self.snack_id)
+        bounds = self.arena_bounds
+        render_x = int(self.x + (offset[0] - bounds.left))
+        render_y = int(self.y + self.bob_offset + (offset[1] - bounds.top))
+        sprite = self._sprite
 
         # Handle despawn flashing
         despawn_progress = self.get_despawn_progress()
         if despawn_progress > 0.7:
-            import time
-            if int(time.time() * 5) % 2 == 0:
-                # Make sprite semi-transparent by creating a copy
-                # Using set_alpha on a convert_alpha() copy is safe, but we use
-                # fill+BLEND_RGBA_MULT as a more reliable cross-platform approach
-                sprite = sprite.copy()
-                alpha_surface = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
-                alpha_surface.fill((255, 255, 255, 128))
-                sprite.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            if int(_time() * 5) % 2 == 0:
+                sprite = _faded(sprite)
 
         # Draw the sprite
         surface.blit(sprite, (render_x, render_y))
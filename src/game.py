@@ -2,12 +2,14 @@
 
 import pygame
 import os
+import time
 from typing import Optional
 from pathlib import Path
 
 from .core.config_manager import ConfigManager
 from .core.event_bus import EventBus, GameEvent
 from .core.state_machine import StateMachine, GameState
+from .entities.player import begin_frame as begin_player_frame
 from .screens.main_menu import MainMenuScreen
 from .screens.character_select import CharacterSelectScreen
 from .screens.gameplay import GameplayScreen
@@ -24,6 +26,30 @@ from .audio.audio_manager import AudioManager
 DEFAULT_DISPLAY_WIDTH = 1200
 DEFAULT_DISPLAY_HEIGHT = 1000
 
+# SDL events no screen reads; blocked so they are never queued or converted.
+# This is a block list rather than an allow list: TEXTINPUT must stay enabled
+# for KEYDOWN.unicode (text entry), and window events drive VIDEORESIZE.
+BLOCKED_EVENTS = [
+    pygame.ACTIVEEVENT,
+    pygame.AUDIODEVICEADDED,
+    pygame.AUDIODEVICEREMOVED,
+    pygame.FINGERDOWN,
+    pygame.FINGERUP,
+    pygame.FINGERMOTION,
+    pygame.JOYDEVICEADDED,
+    pygame.JOYDEVICEREMOVED,
+    pygame.CONTROLLERDEVICEADDED,
+    pygame.CONTROLLERDEVICEREMOVED,
+    pygame.CONTROLLERDEVICEREMAPPED,
+    pygame.DROPBEGIN,
+    pygame.DROPFILE,
+    pygame.DROPTEXT,
+    pygame.DROPCOMPLETE,
+    pygame.KEYMAPCHANGED,
+    pygame.CLIPBOARDUPDATE,
+    pygame.LOCALECHANGED,
+]
+
 
 class Game:
     """Main game class that runs the game loop with detailed retro pixel art."""
@@ -32,7 +58,6 @@ class Game:
         """Initialize the game."""
         # Initialize Pygame
         pygame.init()
-        pygame.font.init()
 
         # Get the directory where this file is located
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -68,19 +93,40 @@ class Game:
         self.screen_height = int(self.game_height * self.scale_factor)
 
         self.fps = self.config.get("game_settings.window.fps", 60)
+        # Opt-in: scale with nearest-neighbour even at fractional zoom (crisp pixels, cheaper than smoothscale)
+        self.pixel_art_scaling = self.config.get("game_settings.window.pixel_art_scaling", False)
         title = self.config.get("game_settings.window.title", "Jazzy's Treat Storm")
+        # Present through SDL's GPU renderer, synced to the display refresh
+        self.vsync = self.config.get("game_settings.window.vsync", False)
 
         # Create the display surface (actual window) - resizable
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
+        if self.vsync:
+            try:
+                # SCALED letterboxes the game-size display into the window on the
+                # GPU and maps mouse positions back, so the game draws unscaled
+                self.screen = pygame.display.set_mode((self.game_width, self.game_height),
+                                                      pygame.SCALED | pygame.RESIZABLE, vsync=1)
+                self.scale_factor = 1.0
+                self.screen_width = self.game_width
+                self.screen_height = self.game_height
+            except pygame.error:
+                # No vsync-capable renderer; fall back to software scaling
+                self.vsync = False
+        if not self.vsync:
+            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
         pygame.display.set_caption(title)
+        pygame.event.set_blocked(BLOCKED_EVENTS)
 
         # Create internal game surface at full resolution
         self.game_surface = pygame.Surface((self.game_width, self.game_height))
 
+        # Scaled copy of the game surface, reused until the window size changes
+        self._scaled_surface: Optional[pygame.Surface] = None
+
         # Update config with internal game dimensions so screens use correct size
         # (screens read from config for their dimensions)
-        self.config._configs["game_settings"]["window"]["width"] = self.game_width
-        self.config._configs["game_settings"]["window"]["height"] = self.game_height
+        self.config.set("game_settings.window.width", self.game_width)
+        self.config.set("game_settings.window.height", self.game_height)
 
         # Initialize audio
         self.audio_manager = AudioManager(self.config, self.event_bus)
@@ -143,8 +189,13 @@ class Game:
     def run(self) -> None:
         """Run the main game loop."""
         while self.running:
-            # Calculate delta time
-            dt = self.clock.tick(self.fps) / 1000.0  # Convert to seconds
+            # Calculate delta time. With vsync, flip() already waits for the
+            # display refresh, so the clock only measures instead of sleeping.
+            if self.vsync:
+                dt = self.clock.tick() / 1000.0  # Convert to seconds
+            else:
+                dt = self.clock.tick(self.fps) / 1000.0  # Convert to seconds
+            begin_player_frame(time.time())
 
             # Handle events
             self._handle_events()
@@ -168,14 +219,18 @@ class Game:
 
     def _handle_events(self) -> None:
         """Handle pygame events."""
+        resized = False
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.VIDEORESIZE:
-                # Handle window resize
+                if self.vsync:
+                    # The SCALED renderer resizes its presentation itself
+                    continue
+                # Handle window resize (the display is updated once, after the loop)
                 self.screen_width = event.w
                 self.screen_height = event.h
-                self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
+                resized = True
                 # Update scale factor based on new window size
                 scale_x = self.screen_width / self.game_width
                 scale_y = self.screen_height / self.game_height
@@ -216,17 +271,21 @@ class Game:
                 if current_screen:
                     current_screen.handle_event(event)
 
+        if resized:
+            self._apply_window_size()
+
+    def _apply_window_size(self) -> None:
+        """Match the display surface to the latest window size after resizing."""
+        new_size = (self.screen_width, self.screen_height)
+        # SDL usually resizes the display surface itself; only re-create it if not
+        self.screen = pygame.display.get_surface() or self.screen
+        if self.screen.get_size() != new_size:
+            self.screen = pygame.display.set_mode(new_size, pygame.RESIZABLE)
+
     def _render(self) -> None:
         """Render current screen to game surface, then scale to display."""
         current_screen = self.state_machine.get_current_screen()
         if current_screen:
-            # Clear display and game surface
-            self.screen.fill((0, 0, 0))
-            self.game_surface.fill((0, 0, 0))
-
-            # Render screen to internal game surface at full resolution
-            current_screen.render(self.game_surface)
-
             # Scale game surface to fit display window (maintain aspect ratio)
             scaled_width = int(self.game_width * self.scale_factor)
             scaled_height = int(self.game_height * self.scale_factor)
@@ -235,13 +294,59 @@ class Game:
             offset_x = (self.screen_width - scaled_width) // 2
             offset_y = (self.screen_height - scaled_height) // 2
 
+            if self.scale_factor == 1.0:
+                # Nothing to scale: render straight into the centred window area.
+                # The subsurface is made per frame since a resize can replace
+                # the display's pixels.
+                target_rect = pygame.Rect(offset_x, offset_y, self.game_width, self.game_height)
+                if self.screen.get_rect().contains(target_rect):
+                    # Clear display (screens may leave parts of their area transparent)
+                    self.screen.fill((0, 0, 0))
+                    current_screen.render(self.screen.subsurface(target_rect))
+                    return
+
+            # Render screen to internal game surface at full resolution
+            self.game_surface.fill((0, 0, 0))
+            current_screen.render(self.game_surface)
+
             if self.scale_factor != 1.0:
-                scaled_surface = pygame.transform.smoothscale(
-                    self.game_surface, (scaled_width, scaled_height)
-                )
-                self.screen.blit(scaled_surface, (offset_x, offset_y))
+                scaled_size = (scaled_width, scaled_height)
+                scaled_surface = self._scaled_surface
+                if scaled_surface is None or scaled_surface.get_size() != scaled_size:
+                    scaled_surface = pygame.Surface(scaled_size, 0, self.game_surface)
+                    self._scaled_surface = scaled_surface
+                # Whole-number zoom needs no filtering, so use the cheaper nearest-neighbour scale
+                if self.pixel_art_scaling or abs(self.scale_factor - round(self.scale_factor)) < 1e-4:
+                    pygame.transform.scale(self.game_surface, scaled_size, scaled_surface)
+                else:
+                    pygame.transform.smoothscale(self.game_surface, scaled_size, scaled_surface)
+                frame = scaled_surface
             else:
-                self.screen.blit(self.game_surface, (offset_x, offset_y))
+                frame = self.game_surface
+
+            # The frame is opaque, so only the letterbox bars around it need clearing
+            frame_rect = self.screen.blit(frame, (offset_x, offset_y))
+            self._clear_letterbox(frame_rect)
+
+    def _clear_letterbox(self, frame_rect: pygame.Rect) -> None:
+        """
+        Fill the window outside the game frame with black.
+
+        Args:
+            frame_rect: Window area covered by the game frame
+        """
+        screen = self.screen
+        width, height = screen.get_size()
+        black = (0, 0, 0)
+        if frame_rect.top > 0:
+            screen.fill(black, (0, 0, width, frame_rect.top))
+        if frame_rect.bottom < height:
+            screen.fill(black, (0, frame_rect.bottom, width, height - frame_rect.bottom))
+        if frame_rect.left > 0:
+            screen.fill(black, (0, frame_rect.top, frame_rect.left, frame_rect.height))
+        if frame_rect.right < width:
+            screen.fill(black, (frame_rect.right, frame_rect.top, width - frame_rect.right,
+                                frame_rect.height))
 
     def _cleanup(self) -> None:
         """Clean up resources."""
@@ -1,5 +1,6 @@
 """Interaction module for audience participation (Twitch, YouTube, etc.)."""
 
+from .async_loop import AsyncLoopThread
 from .twitch_chat import TwitchChatManager, TWITCH_VOTE_EVENT
 
-__all__ = ["TwitchChatManager", "TWITCH_VOTE_EVENT"]
+__all__ = ["AsyncLoopThread", "TwitchChatManager", "TWITCH_VOTE_EVENT"]
@@ -0,0 +1,57 @@
+"""Shared background asyncio loop for audience integrations."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+
+class AsyncLoopThread:
+    """One asyncio event loop, run on a daemon thread, shared by all chat bots.
+
+    Integrations schedule their coroutines here instead of each starting
+    its own thread and event loop.
+    """
+
+    _instance: Optional['AsyncLoopThread'] = None
+
+    # Name of the background thread, as shown in debuggers and thread dumps
+    THREAD_NAME = "interaction-asyncio"
+
+    def __new__(cls) -> 'AsyncLoopThread':
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._loop: Optional[asyncio.AbstractEventLoop] = None
+            cls._instance._thread: Optional[threading.Thread] = None
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the shared event loop, starting its thread on first use."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run, args=(loop,), name=self.THREAD_NAME, daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """
+        Schedule a coroutine on the shared loop from any thread.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Future for the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.get_loop())
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop) -> None:
+        """Thread body: run the loop until the process exits."""
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
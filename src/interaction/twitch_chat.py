@@ -3,17 +3,27 @@
 import asyncio
 import threading
 import pygame
-from typing import Optional
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, List, Optional, Tuple
+
+from .async_loop import AsyncLoopThread
 
 # Custom pygame event type for Twitch votes
 TWITCH_VOTE_EVENT = pygame.USEREVENT + 100
 
+# Most undrained votes kept; older ones are dropped under chat spam
+VOTE_QUEUE_SIZE = 1024
+
+# Seconds start() waits for the bot to connect or fail
+CONNECT_TIMEOUT = 5.0
+
 
 class TwitchChatManager:
     """Bridges Twitch chat with the game's voting system.
 
-    Uses a background thread to run the async TwitchIO event loop,
-    posting pygame events when votes are received.
+    Runs the TwitchIO bot on the shared interaction event loop,
+    queueing votes for the game to collect with drain_votes().
     """
 
     def __init__(self, channel: str, token: str):
@@ -26,67 +36,71 @@ class TwitchChatManager:
         self.channel = channel
         # Ensure token has oauth: prefix for twitchio 2.x
         self.token = token if token.startswith('oauth:') else f'oauth:{token}'
-        self.thread: Optional[threading.Thread] = None
         self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bot_future: Optional[Future] = None
         self.bot = None
         self.connected = False
         self.error_message: Optional[str] = None
+        # Set once the bot has connected or failed, waking start()
+        self._ready_event = threading.Event()
+        # (vote_type, voter_id) pairs appended by the bot thread; deque
+        # appends and pops are atomic, so no lock is needed
+        self.vote_queue: Deque[Tuple[str, str]] = deque(maxlen=VOTE_QUEUE_SIZE)
 
     def start(self) -> bool:
-        """Start the Twitch connection in a background thread.
+        """Start the Twitch connection on the shared background loop.
 
         Returns:
             True if connection started successfully, False otherwise.
         """
         try:
-            self.thread = threading.Thread(target=self._run_bot, daemon=True)
-            self.thread.start()
+            self._ready_event.clear()
+            loop_thread = AsyncLoopThread()
+            self.loop = loop_thread.get_loop()
+            self._bot_future = loop_thread.submit(self._run_bot())
 
             # Wait for connection (up to 5 seconds)
-            import time
-            for _ in range(50):
-                time.sleep(0.1)
-                if self.connected:
-                    return True
-                if self.error_message:
-                    return False
+            self._ready_event.wait(timeout=CONNECT_TIMEOUT)
+            if self.connected:
+                return True
 
             # Timeout
-            if not self.connected:
+            if not self.error_message:
                 self.error_message = "Connection timeout"
-            return self.connected
+            return False
 
         except Exception as e:
             self.error_message = str(e)
             return False
 
-    def _run_bot(self) -> None:
-        """Run the bot in a background thread."""
+    async def _run_bot(self) -> None:
+        """Run the bot on the shared loop until it is closed."""
         try:
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-
             # Create bot instance
             self.bot = _VotingBot(
                 token=self.token,
                 channel=self.channel,
+                vote_queue=self.vote_queue,
                 on_ready_callback=self._on_ready,
                 on_error_callback=self._on_error
             )
 
-            self.loop.run_until_complete(self.bot.start())
+            await self.bot.start()
 
         except Exception as e:
             self.error_message = str(e)
             self.connected = False
+            self._ready_event.set()
 
     def _on_ready(self) -> None:
         """Called when bot successfully connects."""
         self.connected = True
+        self._ready_event.set()
 
     def _on_error(self, error: str) -> None:
         """Called when an error occurs."""
         self.error_message = error
+        self._ready_event.set()
 
     def stop(self) -> None:
         """Stop the Twitch connection."""
@@ -100,6 +114,18 @@ class TwitchChatManager:
                 pass
         self.connected = False
 
+    def drain_votes(self) -> List[Tuple[str, str]]:
+        """Take every vote received since the last call.
+
+        Returns:
+            (vote_type, voter_id) pairs, oldest first.
+        """
+        queue = self.vote_queue
+        votes = []
+        while queue:
+            votes.append(queue.popleft())
+        return votes
+
     def is_connected(self) -> bool:
         """Check if currently connected to Twitch."""
         return self.connected
@@ -112,9 +138,11 @@ class TwitchChatManager:
 class _VotingBot:
     """Internal TwitchIO bot for handling vote commands."""
 
-    def __init__(self, token: str, channel: str, on_ready_callback=None, on_error_callback=None):
+    def __init__(self, token: str, channel: str, vote_queue: Deque[Tuple[str, str]],
+                 on_ready_callback=None, on_error_callback=None):
         self.token = token
         self.channel = channel
+        self.vote_queue = vote_queue
         self.on_ready_callback = on_ready_callback
         self.on_error_callback = on_error_callback
         self._bot = None
@@ -156,24 +184,7 @@ class _VotingBot:
                 if not vote_type:
                     return
 
-                if vote_type == 'extend':
-                    pygame.event.post(pygame.event.Event(
-                        TWITCH_VOTE_EVENT,
-                        vote_type="extend",
-                        voter_id=author_name
-                    ))
-                elif vote_type == 'yank':
-                    pygame.event.post(pygame.event.Event(
-                        TWITCH_VOTE_EVENT,
-                        vote_type="yank",
-                        voter_id=author_name
-                    ))
-                else:
-                    pygame.event.post(pygame.event.Event(
-                        TWITCH_VOTE_EVENT,
-                        vote_type=vote_type,
-                        voter_id=author_name
-                    ))
+                manager.vote_queue.append((vote_type, author_name))
 
             async def event_error(bot_self, error, data=None):
                 print(f'Twitch error: {error}')
@@ -180,8 +180,7 @@ class AvatarShowcaseScreen(BaseScreen):
         if self.background_image:
             # Darken the background for dramatic effect
             surface.blit(self.background_image, (0, 0))
-            overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 120))
+            overlay = self.get_overlay((self.screen_width, self.screen_height), (0, 0, 0, 120))
             surface.blit(overlay, (0, 0))
         else:
             surface.fill(self.bg_color)
@@ -2,7 +2,7 @@
 
 import pygame
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..core.state_machine import StateMachine
@@ -20,6 +20,15 @@ SCREEN_WIDTH = DEFAULT_SCREEN_WIDTH
 SCREEN_HEIGHT = DEFAULT_SCREEN_HEIGHT
 GAME_AREA_WIDTH = DEFAULT_GAME_AREA_WIDTH
 
+# Most rendered text surfaces draw_text keeps per screen
+TEXT_CACHE_SIZE = 128
+
+# Default-font instances shared by all screens: size -> font
+_FONT_CACHE: Dict[int, pygame.font.Font] = {}
+
+# Translucent full-area overlays shared by all screens: (width, height, rgba) -> surface
+_OVERLAY_CACHE: Dict[Tuple[int, int, Tuple[int, int, int, int]], pygame.Surface] = {}
+
 
 class BaseScreen(ABC):
     """Abstract base class for all game screens."""
@@ -47,11 +56,32 @@ class BaseScreen(ABC):
         self.menu_font: Optional[pygame.font.Font] = None
         self.small_font: Optional[pygame.font.Font] = None
 
+        # Rendered text for draw_text: (id(font), text, color) -> (font, surface).
+        # The font is kept so a recycled id can never match a different font.
+        self._text_cache: Dict[Tuple[int, str, tuple], Tuple[pygame.font.Font, pygame.Surface]] = {}
+
     def initialize_fonts(self) -> None:
         """Initialize fonts. Call after pygame.init()."""
-        self.title_font = pygame.font.Font(None, 72)
-        self.menu_font = pygame.font.Font(None, 42)
-        self.small_font = pygame.font.Font(None, 28)
+        self.title_font = self.get_default_font(72)
+        self.menu_font = self.get_default_font(42)
+        self.small_font = self.get_default_font(28)
+
+    @staticmethod
+    def get_default_font(size: int) -> pygame.font.Font:
+        """
+        Get pygame's default font at a size, loading it only once.
+
+        Args:
+            size: Font size in pixels
+
+        Returns:
+            Shared font instance (do not change its style)
+        """
+        font = _FONT_CACHE.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            _FONT_CACHE[size] = font
+        return font
 
     @abstractmethod
     def on_enter(self, data: Dict[str, Any] = None) -> None:
@@ -94,7 +124,7 @@ class BaseScreen(ABC):
         Returns:
             Rectangle of the rendered text
         """
-        text_surface = font.render(text, True, color)
+        text_surface = self.render_text(text, font, color)
         text_rect = text_surface.get_rect()
 
         if center:
@@ -104,3 +134,51 @@ class BaseScreen(ABC):
 
         surface.blit(text_surface, text_rect)
         return text_rect
+
+    def get_overlay(self, size: Tuple[int, int], color: Tuple[int, int, int, int]) -> pygame.Surface:
+        """
+        Get a cached overlay surface filled with a translucent color.
+
+        Uses an SRCALPHA surface with alpha in the fill color, since set_alpha()
+        is unreliable on macOS SDL2 Metal. Only use it for fixed colors: every
+        distinct color keeps its own full-size surface.
+
+        Args:
+            size: Overlay (width, height)
+            color: RGBA fill color
+
+        Returns:
+            Cached overlay surface (shared; do not modify)
+        """
+        key = (size[0], size[1], color)
+        overlay = _OVERLAY_CACHE.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(size, pygame.SRCALPHA)
+            overlay.fill(color)
+            _OVERLAY_CACHE[key] = overlay
+        return overlay
+
+    def render_text(self, text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+        """
+        Get antialiased text, rendering it only the first time it is asked for.
+
+        Args:
+            text: Text to render
+            font: Font to use
+            color: Text color
+
+        Returns:
+            Cached text surface (shared; do not modify)
+        """
+        key = (id(font), text, tuple(color))
+        cache = self._text_cache
+        entry = cache.get(key)
+        if entry is not None and entry[0] is font:
+            return entry[1]
+
+        text_surface = font.render(text, True, color)
+        if len(cache) >= TEXT_CACHE_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            del cache[next(iter(cache))]
+        cache[key] = (font, text_surface)
+        return text_surface
@@ -2,7 +2,7 @@
 
 import pygame
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from .base_screen import BaseScreen
 from ..core.state_machine import GameState
 from ..core.event_bus import GameEvent
@@ -26,6 +26,19 @@ class CharacterCard:
         self.selected_p2 = False
         self.hovered = False
 
+        # Colors for the current selection state, set by the select screen
+        # whenever the selection changes (selection_color is None if unselected)
+        self.selection_color: Optional[Tuple[int, int, int]] = None
+        self.render_bg = (25, 35, 60)
+        self.render_border = (60, 70, 100)
+        self.render_border_w = 2
+        self.render_name_color = (255, 255, 255)
+
+        # Profile image scaled to the card, and that image framed by each
+        # selection border color (None = unselected), built on first render
+        self.portrait: Optional[pygame.Surface] = None
+        self.faces: Dict[Optional[Tuple[int, int, int]], pygame.Surface] = {}
+
 
 class CharacterSelectScreen(BaseScreen):
     """Character selection screen for 1P and 2P modes."""
@@ -173,6 +186,30 @@ class CharacterSelectScreen(BaseScreen):
         for i, card in enumerate(self.character_cards):
             card.selected_p1 = (i == self.p1_selection)
             card.selected_p2 = (i == self.p2_selection) if self._requires_second_selection() else False
+            self._update_card_style(card)
+
+    def _update_card_style(self, card: CharacterCard) -> None:
+        """Work out a card's render colors from its selection state."""
+        # Selection state determines border
+        if card.selected_p1 and card.selected_p2:
+            card.selection_color = (200, 150, 255)  # Purple for both
+        elif card.selected_p1:
+            card.selection_color = self.p1_color
+        elif card.selected_p2:
+            card.selection_color = self.p2_color
+        else:
+            card.selection_color = None
+
+        if card.selection_color is not None:
+            card.render_bg = (30, 40, 70)
+            card.render_border = card.selection_color
+            card.render_border_w = 4
+            card.render_name_color = self.highlight_color
+        else:
+            card.render_bg = (25, 35, 60)
+            card.render_border = (60, 70, 100)
+            card.render_border_w = 2
+            card.render_name_color = self.text_color
 
     def on_exit(self) -> None:
         """Clean up when leaving screen."""
@@ -588,58 +625,59 @@ class CharacterSelectScreen(BaseScreen):
         # Apply scroll offset to card position
         draw_rect = card.rect.move(0, -scroll_offset)
 
-        # Selection state determines border
-        if card.selected_p1 and card.selected_p2:
-            border_color = (200, 150, 255)  # Purple for both
-            border_width = 4
-        elif card.selected_p1:
-            border_color = self.p1_color
-            border_width = 4
-        elif card.selected_p2:
-            border_color = self.p2_color
-            border_width = 4
-        else:
-            border_color = (60, 70, 100)
-            border_width = 2
-
         # Get profile image for this character
         char_id = card.character_id.lower()
         profile_img = self.profile_images.get(char_id)
 
         if profile_img:
+            # Center the image in the card (using scrolled position); the face
+            # has a 2px margin around the image for the border
+            face = self._get_card_face(card, profile_img, card.selection_color)
+            face_x = draw_rect.centerx - face.get_width() // 2
+            face_y = draw_rect.centery - face.get_height() // 2
+            surface.blit(face, (face_x, face_y))
+        else:
+            # Fallback: draw card background with name
+            pygame.draw.rect(surface, card.render_bg, draw_rect, border_radius=8)
+            pygame.draw.rect(surface, card.render_border, draw_rect, card.render_border_w, border_radius=8)
+
+            self.draw_text(surface, card.name.upper(), self.menu_font, card.render_name_color,
+                           (draw_rect.centerx, draw_rect.centery))
+
+    def _get_card_face(self, card: CharacterCard, profile_img: pygame.Surface,
+                       selection_color: Optional[Tuple[int, int, int]]) -> pygame.Surface:
+        """
+        Get a card's scaled profile image framed by its selection border.
+
+        Args:
+            card: Card being drawn
+            profile_img: Full-size profile image for the card's character
+            selection_color: Border color, or None for an unselected card
+
+        Returns:
+            Cached face surface, 4px larger than the scaled image
+        """
+        face = card.faces.get(selection_color)
+        if face is not None:
+            return face
+
+        if card.portrait is None:
             # Scale profile image to fit card (80% of card size)
-            img_width = (draw_rect.width - 10) * 0.8
-            img_height = (draw_rect.height - 10) * 0.8
+            img_width = (card.rect.width - 10) * 0.8
+            img_height = (card.rect.height - 10) * 0.8
 
             # Maintain aspect ratio
             orig_rect = profile_img.get_rect()
             scale = min(img_width / orig_rect.width, img_height / orig_rect.height)
             new_width = int(orig_rect.width * scale)
             new_height = int(orig_rect.height * scale)
-            scaled_img = pygame.transform.scale(profile_img, (new_width, new_height))
-
-            # Center the image in the card (using scrolled position)
-            img_x = draw_rect.centerx - new_width // 2
-            img_y = draw_rect.centery - new_height // 2
+            card.portrait = pygame.transform.scale(profile_img, (new_width, new_height))
 
-            surface.blit(scaled_img, (img_x, img_y))
+        portrait = card.portrait
+        face = pygame.Surface((portrait.get_width() + 4, portrait.get_height() + 4), pygame.SRCALPHA)
+        face.blit(portrait, (2, 2))
+        if selection_color is not None:
+            pygame.draw.rect(face, selection_color, face.get_rect(), 4, border_radius=20)
 
-            # Draw selection border on top of image
-            if card.selected_p1 or card.selected_p2:
-                border_rect = pygame.Rect(img_x - 2, img_y - 2, new_width + 4, new_height + 4)
-                if card.selected_p1 and card.selected_p2:
-                    selection_color = (200, 150, 255)
-                elif card.selected_p1:
-                    selection_color = self.p1_color
-                else:
-                    selection_color = self.p2_color
-                pygame.draw.rect(surface, selection_color, border_rect, 4, border_radius=20)
-        else:
-            # Fallback: draw card background with name
-            bg_color = (30, 40, 70) if (card.selected_p1 or card.selected_p2) else (25, 35, 60)
-            pygame.draw.rect(surface, bg_color, draw_rect, border_radius=8)
-            pygame.draw.rect(surface, border_color, draw_rect, border_width, border_radius=8)
-
-            name_color = self.highlight_color if (card.selected_p1 or card.selected_p2) else self.text_color
-            self.draw_text(surface, card.name.upper(), self.menu_font, name_color,
-                           (draw_rect.centerx, draw_rect.centery))
+        card.faces[selection_color] = face
+        return face
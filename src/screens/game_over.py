@@ -448,7 +448,7 @@ class GameOverScreen(BaseScreen):
         # Color for dog names and scores
         name_color = (147, 76, 48)  # #934C30
         name_font = self.daydream_font_large if self.daydream_font_large else self.menu_font
-        score_font = self.daydream_font_score if self.daydream_font_score else pygame.font.Font(None, 80)
+        score_font = self.daydream_font_score if self.daydream_font_score else self.get_default_font(80)
         score_label_font = self.daydream_font_small if self.daydream_font_small else self.small_font
 
         # P1 score box
@@ -10,7 +10,7 @@ from ..core.event_bus import GameEvent
 from ..core.env_loader import load_env, get_twitch_token
 from ..entities.player import Player
 from ..entities.ai_player import AIPlayer
-from ..entities.snack import Snack
+from ..entities.snack import Snack, effect_code, make_effect
 from ..interaction.twitch_chat import TwitchChatManager, TWITCH_VOTE_EVENT
 from ..sprites.sprite_sheet_loader import AnimationState
 from ..effects.round_start_intro import RoundStartIntro
@@ -34,7 +34,8 @@ class FallingSnack:
         self.snack_id = snack_config.get("id", "pizza")
         self.name = snack_config.get("name", "Snack")
         self.point_value = snack_config.get("point_value", 100)
-        self.effect = snack_config.get("effect")
+        self.effect = make_effect(snack_config.get("effect"))
+        self.effect_code = effect_code(self.effect)
         self.color = tuple(snack_config.get("color", [255, 255, 255]))
         self.scale = scale  # Scale multiplier for size
 
@@ -43,11 +44,25 @@ class FallingSnack:
         self.width = int(SpriteSheetLoader.FOOD_SIZE[0] * scale)
         self.height = int(SpriteSheetLoader.FOOD_SIZE[1] * scale)
 
+        # Sprite, resolved and scaled once: PNG food sprite first, procedural fallback
+        from ..sprites.pixel_art import SpriteCache
+        sprite = SpriteSheetLoader().get_food_sprite(self.snack_id)
+        if sprite is None:
+            sprite = SpriteCache().get_snack_sprite(self.snack_id)
+        if scale != 1.0:
+            sprite = pygame.transform.scale(sprite, (self.width, self.height))
+        self._sprite = sprite
+
         self.arena_bounds = arena_bounds
         self.x = x
         self.y = arena_bounds.top + 60  # Start lower, below menu bar
         self.fall_speed = fall_speed
 
+        # Collision rectangle, kept in step with the position in update()
+        self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        # Shrunken pickup hitbox (10px in from each side), moved with _rect
+        self._hitbox = self._rect.inflate(-20, -20)
+
         # Ground level where snacks disappear (at player's feet level)
         self.ground_y = ground_y if ground_y else arena_bounds.bottom - 20
 
@@ -62,8 +77,18 @@ class FallingSnack:
 
     @property
     def rect(self) -> pygame.Rect:
-        """Get the snack's collision rectangle."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """Get the snack's collision rectangle (shared; do not modify)."""
+        return self._rect
+
+    @property
+    def hitbox(self) -> pygame.Rect:
+        """Get the snack's pickup hitbox (shared; do not modify)."""
+        return self._hitbox
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        """Get the snack's center position."""
+        return (self.x + self.width / 2, self.y + self.height / 2)
 
     def update(self, dt: float) -> bool:
         """Update snack position. Returns False if should be removed."""
@@ -71,6 +96,8 @@ class FallingSnack:
             return False
 
         self.y += self.fall_speed * dt
+        self._rect.y = int(self.y)
+        self._hitbox.y = self._rect.y + 10
         self.rotation_angle += self.rotation_speed * dt
 
         # Remove if fallen past ground level (where player stands)
@@ -92,35 +119,30 @@ class FallingSnack:
 
     def render(self, surface: pygame.Surface) -> None:
         """Render the falling snack."""
+        blit = self.get_blit()
+        if blit is not None:
+            surface.blit(*blit)
+
+    def get_blit(self) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Get the snack's rotated sprite and where to draw it.
+
+        Returns:
+            (sprite, dest rect relative to the arena) for Surface.blit/blits,
+            or None if the snack is inactive
+        """
         if not self.active:
-            return
-
-        from ..sprites.sprite_sheet_loader import SpriteSheetLoader
-        from ..sprites.pixel_art import SpriteCache
+            return None
 
         # Position relative to arena
         render_x = int(self.x - self.arena_bounds.left)
         render_y = int(self.y - self.arena_bounds.top)
 
-        # Try to get PNG food sprite first
-        loader = SpriteSheetLoader()
-        sprite = loader.get_food_sprite(self.snack_id)
-
-        # Fall back to procedural sprite if PNG not available
-        if sprite is None:
-            cache = SpriteCache()
-            sprite = cache.get_snack_sprite(self.snack_id)
-
-        # Scale sprite if scale factor is not 1.0
-        if self.scale != 1.0:
-            scaled_size = (self.width, self.height)
-            sprite = pygame.transform.scale(sprite, scaled_size)
-
         # Rotate the sprite
-        rotated_sprite = pygame.transform.rotate(sprite, self.rotation_angle)
+        rotated_sprite = pygame.transform.rotate(self._sprite, self.rotation_angle)
         # Center the rotated sprite at the original position
         rotated_rect = rotated_sprite.get_rect(center=(render_x + self.width // 2, render_y + self.height // 2))
-        surface.blit(rotated_sprite, rotated_rect)
+        return rotated_sprite, rotated_rect
 
 
 class Arena:
@@ -336,12 +358,23 @@ class Arena:
             interval = self.base_spawn_interval / self.spawn_rate_multiplier
             self.spawn_timer = interval + random.uniform(-0.3, 0.3)
 
-        # Update snacks (remove inactive ones)
-        self.snacks = [s for s in self.snacks if s.update(dt)]
+        # Update snacks, dropping inactive ones in place
+        snacks = self.snacks
+        kept = 0
+        for snack in snacks:
+            if snack.update(dt):
+                snacks[kept] = snack
+                kept += 1
+        del snacks[kept:]
 
         # Update snack glow timer
         self.snack_glow.update(dt)
 
+    def remove_snack(self, snack: FallingSnack) -> None:
+        """Remove a collected snack so self.snacks only holds active snacks."""
+        if snack in self.snacks:
+            self.snacks.remove(snack)
+
     def render(self) -> pygame.Surface:
         """Render the arena with background image or wooden floor."""
         # Clear the surface
@@ -388,15 +421,24 @@ class Arena:
         if self.lightning_active and self.lightning_segments:
             self._draw_lightning()
 
-        # Draw snacks (with glow for power-up items)
+        # Draw snacks (with glow for power-up items). Sprites are batched
+        # into one blits() call, flushed before each glow to keep the order.
+        snack_blits = []
         for snack in self.snacks:
             if self.snack_glow.should_glow(snack.snack_id):
+                if snack_blits:
+                    self.surface.blits(snack_blits, doreturn=False)
+                    snack_blits.clear()
                 # Render pulsing glow + sparkles behind the snack sprite
                 cx = int(snack.x - self.bounds.left + snack.width // 2)
                 cy = int(snack.y - self.bounds.top + snack.height // 2)
                 self.snack_glow.render(self.surface, cx, cy,
                                        snack.snack_id, snack.color)
-            snack.render(self.surface)
+            blit = snack.get_blit()
+            if blit is not None:
+                snack_blits.append(blit)
+        if snack_blits:
+            self.surface.blits(snack_blits, doreturn=False)
 
         # Draw player
         self.player.render(self.surface)
@@ -2068,23 +2110,25 @@ class GameplayScreen(BaseScreen):
 
         elif event.type == TWITCH_VOTE_EVENT:
             # Process Twitch vote
-            vote_type = event.vote_type
-            voter_id = event.voter_id
-            if self.voting_system and self.voting_system.add_vote(vote_type, voter_id):
-                # Show in chat simulator
-                palette = [
-                    (81, 180, 71),
-                    (221, 68, 61),
-                    (80, 160, 220),
-                    (220, 180, 60),
-                ]
-                color = (200, 200, 200)
-                for idx, opt in enumerate(self.voting_system.options):
-                    if opt.lower() == vote_type.lower():
-                        color = palette[idx % len(palette)]
-                        break
-                if self.chat_simulator:
-                    self.chat_simulator.add_message(voter_id[:10], f"!{vote_type}", color)
+            self._handle_twitch_vote(event.vote_type, event.voter_id)
+
+    def _handle_twitch_vote(self, vote_type: str, voter_id: str) -> None:
+        """Count a Twitch chat vote and echo it in the chat panel."""
+        if self.voting_system and self.voting_system.add_vote(vote_type, voter_id):
+            # Show in chat simulator
+            palette = [
+                (81, 180, 71),
+                (221, 68, 61),
+                (80, 160, 220),
+                (220, 180, 60),
+            ]
+            color = (200, 200, 200)
+            for idx, opt in enumerate(self.voting_system.options):
+                if opt.lower() == vote_type.lower():
+                    color = palette[idx % len(palette)]
+                    break
+            if self.chat_simulator:
+                self.chat_simulator.add_message(voter_id[:10], f"!{vote_type}", color)
 
     def _handle_key_down(self, key: int) -> None:
         """Handle key press."""
@@ -2154,6 +2198,13 @@ class GameplayScreen(BaseScreen):
 
     def update(self, dt: float) -> None:
         """Update gameplay state."""
+        # Collect Twitch votes since the last frame (ignored during the storm intro)
+        if self.twitch_manager:
+            votes = self.twitch_manager.drain_votes()
+            if not self.storm_intro_active:
+                for vote_type, voter_id in votes:
+                    self._handle_twitch_vote(vote_type, voter_id)
+
         if self.paused:
             return
 
@@ -2344,40 +2395,41 @@ class GameplayScreen(BaseScreen):
         p2_hitbox = self.player2.rect.inflate(-80, -80) if self.player2 else None
 
         # Player 1 collisions with their own arena
-        for snack in self.arena1.snacks[:]:
-            if not snack.active:
-                continue
-            snack_hitbox = snack.rect.inflate(-20, -20)
-            if p1_hitbox.colliderect(snack_hitbox):
-                self._collect_snack(self.player1, snack)
+        self._collect_hits(self.player1, p1_hitbox, self.arena1)
 
         # Player 2 collisions with their own arena
         if self.player2 and self.arena2 and p2_hitbox:
-            for snack in self.arena2.snacks[:]:
-                if not snack.active:
-                    continue
-                snack_hitbox = snack.rect.inflate(-20, -20)
-                if p2_hitbox.colliderect(snack_hitbox):
-                    self._collect_snack(self.player2, snack)
+            self._collect_hits(self.player2, p2_hitbox, self.arena2)
 
         # Cross-arena collisions when unleashed!
         # Player 1 can steal from arena 2 if they've crossed over
         if self.player1.get_leash_state() == "extended" and self.arena2:
-            for snack in self.arena2.snacks[:]:
-                if not snack.active:
-                    continue
-                snack_hitbox = snack.rect.inflate(-20, -20)
-                if p1_hitbox.colliderect(snack_hitbox):
-                    self._collect_snack(self.player1, snack, stolen=True)
+            self._collect_hits(self.player1, p1_hitbox, self.arena2, stolen=True)
 
         # Player 2 can steal from arena 1 if they've crossed over
         if self.player2 and self.arena2 and p2_hitbox and self.player2.get_leash_state() == "extended":
-            for snack in self.arena1.snacks[:]:
-                if not snack.active:
-                    continue
-                snack_hitbox = snack.rect.inflate(-20, -20)
-                if p2_hitbox.colliderect(snack_hitbox):
-                    self._collect_snack(self.player2, snack, stolen=True)
+            self._collect_hits(self.player2, p2_hitbox, self.arena1, stolen=True)
+
+    def _collect_hits(self, player: Player, player_hitbox: pygame.Rect, arena: Arena,
+                      stolen: bool = False) -> None:
+        """
+        Collect every snack in an arena that touches a player's hitbox.
+
+        Args:
+            player: Player doing the collecting
+            player_hitbox: The player's shrunken collision rectangle
+            arena: Arena whose snacks are checked
+            stolen: True when collecting from the opponent's arena
+        """
+        snacks = arena.snacks
+        hits = player_hitbox.collidelistall([snack.hitbox for snack in snacks])
+        if not hits:
+            return
+
+        for snack in [snacks[i] for i in hits]:
+            if snack.active:
+                self._collect_snack(player, snack, stolen=stolen)
+                arena.remove_snack(snack)
 
     def _collect_snack(self, player: Player, snack: FallingSnack, stolen: bool = False) -> None:
         """Handle snack collection."""
@@ -2415,7 +2467,7 @@ class GameplayScreen(BaseScreen):
         effect = result.get("effect")
         if effect:
             # Special handling for Chili/Chaos effect
-            if effect["type"] == "chaos" and player.character_id == "jazzy":
+            if effect.kind == "chaos" and player.character_id == "jazzy":
                 # Trigger special Jazzy cutscene sequence
                 self.chili_sequence_active = True
                 self.chili_timer = 0.0
@@ -2424,25 +2476,25 @@ class GameplayScreen(BaseScreen):
                 
                 # Apply the effect logic (reverse controls) but delay the chaos shake slightly
                 player.apply_effect(
-                    effect["type"],
-                    effect["magnitude"],
-                    effect["duration_seconds"]
+                    effect.kind,
+                    effect.magnitude,
+                    effect.duration
                 )
             # Check if this is a negative effect and player is invincible
-            elif player.is_invincible and effect["type"] in ["slow", "chaos"]:
+            elif player.is_invincible and effect.kind in ["slow", "chaos"]:
                 # Player is invincible - skip negative effect
                 pass
             else:
                 player.apply_effect(
-                    effect["type"],
-                    effect["magnitude"],
-                    effect["duration_seconds"]
+                    effect.kind,
+                    effect.magnitude,
+                    effect.duration
                 )
 
                 # Trigger chaos screen shake
-                if effect["type"] == "chaos":
+                if effect.kind == "chaos":
                     self.shake_intensity = 5
-                    self.shake_duration = effect["duration_seconds"]
+                    self.shake_duration = effect.duration
 
     def _apply_vote_effect(self, vote_winner: str) -> None:
         """Apply the winning vote effect to both players."""
@@ -2662,10 +2714,8 @@ class GameplayScreen(BaseScreen):
             red_val = 200 + int(50 * abs(pygame.time.get_ticks() % 500 - 250) / 250)
             pygame.draw.rect(surface, (red_val, 0, 0), (0, 0, self.game_area_width, self.screen_height), border_thickness)
 
-            # Additional screen tinted overlay
-            # Use SRCALPHA with alpha in fill color — set_alpha() is unreliable on macOS SDL2 Metal
-            overlay = pygame.Surface((self.game_area_width, self.screen_height), pygame.SRCALPHA)
-            overlay.fill((255, 0, 0, 30))  # Slight red tint
+            # Additional screen tinted overlay (slight red tint)
+            overlay = self.get_overlay((self.game_area_width, self.screen_height), (255, 0, 0, 30))
             surface.blit(overlay, (0, 0))
 
     def _render_crowd_chaos_tint(self, surface: pygame.Surface) -> None:
@@ -2750,8 +2800,7 @@ class GameplayScreen(BaseScreen):
         if not (self.final_round_trivia_active or self.final_round_trivia_result_timer > 0):
             return
 
-        overlay = pygame.Surface((self.game_area_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((18, 10, 10, 185))
+        overlay = self.get_overlay((self.game_area_width, self.screen_height), (18, 10, 10, 185))
         surface.blit(overlay, (0, 0))
 
         panel_rect = pygame.Rect(110, 210, self.game_area_width - 220, 390)
@@ -2979,7 +3028,7 @@ class GameplayScreen(BaseScreen):
 
     def _render_point_popups(self, surface: pygame.Surface, shake_x: int, shake_y: int) -> None:
         """Render floating point popups when treats are collected."""
-        popup_font = self.daydream_font_popup if self.daydream_font_popup else pygame.font.Font(None, 32)
+        popup_font = self.daydream_font_popup if self.daydream_font_popup else self.get_default_font(32)
         popup_color = (81, 180, 71)  # #51B447
         outline_color = (255, 255, 255)  # White outline
 
@@ -3013,7 +3062,7 @@ class GameplayScreen(BaseScreen):
             text = "GO!"
 
         # Draw large countdown text (centered in game area) with Daydream font and #FBCD64 color
-        countdown_font = self.daydream_font_countdown if self.daydream_font_countdown else pygame.font.Font(None, 180)
+        countdown_font = self.daydream_font_countdown if self.daydream_font_countdown else self.get_default_font(180)
         countdown_color = (251, 205, 100)  # #FBCD64
         text_surface = countdown_font.render(text, True, countdown_color)
         text_rect = text_surface.get_rect(center=(self.game_area_width // 2, self.screen_height // 2))
@@ -3022,9 +3071,7 @@ class GameplayScreen(BaseScreen):
     def _render_pause(self, surface: pygame.Surface) -> None:
         """Render the pause overlay."""
         # Semi-transparent overlay (only over game area)
-        # Use SRCALPHA + alpha in fill — set_alpha() on plain Surface is broken on macOS SDL2 Metal
-        overlay = pygame.Surface((self.game_area_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
+        overlay = self.get_overlay((self.game_area_width, self.screen_height), (0, 0, 0, 200))
         surface.blit(overlay, (0, 0))
 
         center_x = self.game_area_width // 2
@@ -3111,7 +3158,7 @@ class GameplayScreen(BaseScreen):
     def _render_announcement(self, surface: pygame.Surface) -> None:
         """Render a big dramatic announcement in the center of the screen."""
         # Use Daydream font for announcement
-        large_font = self.daydream_font if self.daydream_font else pygame.font.Font(None, 100)
+        large_font = self.daydream_font if self.daydream_font else self.get_default_font(100)
         subtitle_font = self.daydream_font_small if self.daydream_font_small else self.small_font
 
         # Render text with shadow
@@ -3337,7 +3384,7 @@ class GameplayScreen(BaseScreen):
         center_x = self.game_area_width // 2
         center_y = self.screen_height // 2
 
-        countdown_font = self.daydream_font_countdown if self.daydream_font_countdown else pygame.font.Font(None, 80)
+        countdown_font = self.daydream_font_countdown if self.daydream_font_countdown else self.get_default_font(80)
         countdown_color = (251, 205, 100)  # #FBCD64
 
         text_surface = countdown_font.render("GO!", True, countdown_color)
@@ -401,19 +401,19 @@ class TreatAttackGameplay(BaseScreen):
             self.treats.append(new_treat)
 
         # Update treats and check collisions
-        active_treats = []
-        for treat in self.treats:
-            if treat.update(dt):
-                # Check collision with dog
-                if self.dog.check_collision(treat.rect):
-                    result = treat.collect()
-                    self.score += result["point_value"]
-                    self.dog.trigger_eat()
-
-                    # Emit event
-                    self.event_bus.emit(GameEvent.SNACK_COLLECTED, result)
-                else:
-                    active_treats.append(treat)
+        active_treats = [treat for treat in self.treats if treat.update(dt)]
+
+        # Check collision with dog for all treats at once
+        caught = self.dog.check_collisions([treat.rect for treat in active_treats])
+        if caught:
+            for i in caught:
+                result = active_treats[i].collect()
+                self.score += result["point_value"]
+                self.dog.trigger_eat()
+
+                # Emit event
+                self.event_bus.emit(GameEvent.SNACK_COLLECTED, result)
+            active_treats = [treat for treat in active_treats if treat.active]
 
         self.treats = active_treats
 
@@ -540,8 +540,7 @@ class TreatAttackGameplay(BaseScreen):
     def _render_pause(self, surface: pygame.Surface) -> None:
         """Render pause overlay."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.game_width, self.game_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
+        overlay = self.get_overlay((self.game_width, self.game_height), (0, 0, 0, 128))
         surface.blit(overlay, (0, 0))
 
         # Pause text
@@ -557,8 +556,7 @@ class TreatAttackGameplay(BaseScreen):
     def _render_game_over(self, surface: pygame.Surface) -> None:
         """Render game over overlay."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.game_width, self.game_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = self.get_overlay((self.game_width, self.game_height), (0, 0, 0, 180))
         surface.blit(overlay, (0, 0))
 
         # Game over text
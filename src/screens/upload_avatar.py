@@ -459,7 +459,7 @@ class UploadAvatarScreen(BaseScreen):
 
         # Display masked key
         display_key = "*" * min(len(self.api_key), 40) if self.api_key else ""
-        key_font = self.small_font or pygame.font.Font(None, 24)
+        key_font = self.small_font or self.get_default_font(24)
         if display_key:
             self.draw_text(surface, display_key, key_font,
                            self.text_color, (cx, input_y + input_h // 2))
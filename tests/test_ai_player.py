@@ -0,0 +1,71 @@
+"""Unit tests for AIPlayer snack selection."""
+
+import os
+import unittest
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.core.config_manager import ConfigManager
+from src.entities.ai_player import AIPlayer
+from src.entities.snack import EFFECT_NONE, EFFECT_SPEED_BOOST
+
+
+class TestAIPlayerBestSnack(unittest.TestCase):
+    """Verify the AI targets the snack evaluate_snack scores highest."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ConfigManager._instance = None
+        cls.config = ConfigManager()
+        cls.config.initialize(os.path.join(base_dir, "config"))
+
+    @classmethod
+    def tearDownClass(cls):
+        ConfigManager._instance = None
+
+    def setUp(self):
+        character = self.config.get_all_characters()[0]
+        self.ai = AIPlayer(character, pygame.Rect(0, 0, 500, 800),
+                           self.config.get_difficulty("hard"), horizontal_only=True)
+        self.ai.x = 200
+        self.ai.y = 600
+
+    def _snack(self, x, y, point_value=100, effect_code=EFFECT_NONE):
+        return SimpleNamespace(x=x, y=y, point_value=point_value, effect_code=effect_code)
+
+    def test_picks_highest_scoring_snack(self):
+        """A close, reachable snack beats far, unreachable and penalty snacks."""
+        far = self._snack(480, 600)
+        unreachable = self._snack(200, 100)
+        penalty = self._snack(205, 600, point_value=-50)
+        best = self._snack(210, 620)
+        snacks = [far, unreachable, penalty, best]
+
+        self.assertIs(self.ai.best_snack(snacks), best)
+        scores = [self.ai.evaluate_snack(snack) for snack in snacks]
+        self.assertEqual(self.ai.evaluate_snack(best), max(scores))
+
+    def test_power_up_bonus_counts(self):
+        """A power-up seeking AI prefers a power-up over an otherwise equal snack."""
+        self.assertTrue(self.ai.targets_powerups)
+        plain = self._snack(220, 600)
+        boost = self._snack(220, 600, effect_code=EFFECT_SPEED_BOOST)
+
+        self.assertIs(self.ai.best_snack([plain, boost]), boost)
+
+    def test_first_snack_wins_ties(self):
+        """Equally scored snacks resolve to the first in the list."""
+        first = self._snack(190, 600)
+        second = self._snack(210, 600)
+
+        self.assertIs(self.ai.best_snack([first, second]), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""Unit tests for BaseScreen text caching."""
+
+import unittest
+
+import pygame
+
+from src.screens import base_screen
+from src.screens.base_screen import BaseScreen
+
+
+class _Config:
+    """Minimal config that always answers with the default."""
+
+    def get(self, key, default=None):
+        return default
+
+
+class _Screen(BaseScreen):
+    def on_enter(self, data=None):
+        pass
+
+    def on_exit(self):
+        pass
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def render(self, surface):
+        pass
+
+
+class TestDrawTextCache(unittest.TestCase):
+    """Verify draw_text reuses rendered text and keeps the cache bounded."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.screen = _Screen(None, _Config(), None)
+        self.font = pygame.font.Font(None, 28)
+        self.surface = pygame.Surface((200, 100))
+
+    def test_same_text_renders_once(self):
+        """Repeated draws of the same text reuse one surface."""
+        first = self.screen.render_text("P1", self.font, (255, 255, 255))
+        second = self.screen.render_text("P1", self.font, [255, 255, 255])
+        self.assertIs(first, second)
+
+        other = self.screen.render_text("P1", self.font, (255, 0, 0))
+        self.assertIsNot(first, other)
+
+    def test_draw_text_positions_cached_surface(self):
+        """draw_text still centres or top-left aligns the text."""
+        centered = self.screen.draw_text(self.surface, "GO", self.font, (255, 255, 255), (100, 50))
+        self.assertEqual(centered.center, (100, 50))
+
+        topleft = self.screen.draw_text(self.surface, "GO", self.font, (255, 255, 255), (5, 6),
+                                        center=False)
+        self.assertEqual(topleft.topleft, (5, 6))
+        self.assertEqual(len(self.screen._text_cache), 1)
+
+    def test_cache_is_bounded(self):
+        """The oldest text is dropped once the cache is full."""
+        for i in range(base_screen.TEXT_CACHE_SIZE + 5):
+            self.screen.render_text(str(i), self.font, (255, 255, 255))
+
+        cache = self.screen._text_cache
+        self.assertEqual(len(cache), base_screen.TEXT_CACHE_SIZE)
+        self.assertNotIn((id(self.font), "0", (255, 255, 255)), cache)
+        self.assertIn((id(self.font), str(base_screen.TEXT_CACHE_SIZE + 4), (255, 255, 255)), cache)
+
+
+class TestDefaultFonts(unittest.TestCase):
+    """Verify default fonts are loaded once and shared between screens."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def test_screens_share_default_fonts(self):
+        """Two screens initialising their fonts get the same instances."""
+        first = _Screen(None, _Config(), None)
+        second = _Screen(None, _Config(), None)
+        first.initialize_fonts()
+        second.initialize_fonts()
+
+        self.assertIs(first.title_font, second.title_font)
+        self.assertIs(first.menu_font, second.menu_font)
+        self.assertIs(first.small_font, second.small_font)
+        self.assertIs(first.small_font, BaseScreen.get_default_font(28))
+
+
+class TestOverlayCache(unittest.TestCase):
+    """Verify translucent overlays are built once and shared."""
+
+    def test_overlay_is_shared_between_screens(self):
+        """Screens asking for the same overlay get one surface."""
+        first = _Screen(None, _Config(), None).get_overlay((40, 30), (0, 0, 0, 200))
+        second = _Screen(None, _Config(), None).get_overlay((40, 30), (0, 0, 0, 200))
+        self.assertIs(first, second)
+        self.assertEqual(first.get_size(), (40, 30))
+        self.assertEqual(tuple(first.get_at((5, 5))), (0, 0, 0, 200))
+
+    def test_overlay_color_and_size_are_part_of_the_key(self):
+        """A different color or size gets its own overlay."""
+        screen = _Screen(None, _Config(), None)
+        base = screen.get_overlay((40, 30), (0, 0, 0, 200))
+        self.assertIsNot(base, screen.get_overlay((40, 30), (0, 0, 0, 120)))
+        self.assertIsNot(base, screen.get_overlay((41, 30), (0, 0, 0, 200)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Unit tests for ConfigManager lookups and caching."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class TestConfigManagerLookups(unittest.TestCase):
+    """Verify cached dot-path lookups and id indexes stay in sync with the configs."""
+
+    def setUp(self):
+        """Copy the real config dir to a temp location so we can mutate freely."""
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        real_config = os.path.join(base_dir, "config")
+        self.tmp_dir    = tempfile.mkdtemp()
+        self.tmp_config = os.path.join(self.tmp_dir, "config")
+        shutil.copytree(real_config, self.tmp_config)
+
+        # Reset singleton so each test gets a fresh instance
+        from src.core.config_manager import ConfigManager
+        ConfigManager._instance = None
+        self.config = ConfigManager()
+        self.config.initialize(self.tmp_config)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        from src.core.config_manager import ConfigManager
+        ConfigManager._instance = None
+
+    def test_missing_path_returns_default(self):
+        """Missing paths return the caller's default on every call."""
+        self.assertEqual(self.config.get("game_settings.no_such_key", 5), 5)
+        self.assertEqual(self.config.get("game_settings.no_such_key", 7), 7)
+        self.assertIsNone(self.config.get("game_settings.no_such_key"))
+
+    def test_cached_value_updated_after_setting_change(self):
+        """A cached lookup reflects values written through update_audio_setting()."""
+        self.config.get("audio_settings.master_volume")
+        self.config.update_audio_setting("master_volume", 0.25)
+        self.assertEqual(self.config.get("audio_settings.master_volume"), 0.25)
+
+    def test_cached_value_updated_after_set(self):
+        """A cached lookup reflects values written through set()."""
+        self.config.get("game_settings.window.width")
+        self.config.set("game_settings.window.width", 1234)
+        self.assertEqual(self.config.get("game_settings.window.width"), 1234)
+
+    def test_set_creates_missing_sections(self):
+        """set() creates intermediate sections that do not exist yet."""
+        self.assertIsNone(self.config.get("game_settings.new_section.value"))
+        self.config.set("game_settings.new_section.value", 3)
+        self.assertEqual(self.config.get("game_settings.new_section.value"), 3)
+
+    def test_get_character_by_id(self):
+        """get_character() finds every configured character."""
+        for char in self.config.get_all_characters():
+            self.assertIs(self.config.get_character(char["id"]), char)
+        self.assertIsNone(self.config.get_character("no_such_dog"))
+
+    def test_get_character_after_reload(self):
+        """Characters added on disk are found after reload_config()."""
+        path = os.path.join(self.tmp_config, "characters.json")
+        with open(path) as f:
+            data = json.load(f)
+        data["characters"].append({"id": "custom_dog", "name": "Custom"})
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+        self.config.reload_config("characters")
+        self.assertEqual(self.config.get_character("custom_dog")["name"], "Custom")
+
+    def test_reload_unchanged_file_keeps_config(self):
+        """Reloading a config whose file has not changed skips the re-parse."""
+        before = self.config.get_config("snacks")
+        self.config.reload_config("snacks")
+        self.assertIs(self.config.get_config("snacks"), before)
+
+    def test_get_level_by_number(self):
+        """get_level() finds levels by their level_number."""
+        level = self.config.get_level(1)
+        self.assertIsNotNone(level)
+        self.assertEqual(level["level_number"], 1)
+        self.assertIsNone(self.config.get_level(999))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Unit tests for EventBus dispatch."""
+
+import unittest
+
+from src.core.event_bus import EventBus, GameEvent
+
+
+class TestEventBusDispatch(unittest.TestCase):
+    """Verify listener ordering, removal and queued delivery."""
+
+    def setUp(self):
+        # Reset singleton so each test gets a fresh instance
+        EventBus._instance = None
+        self.bus = EventBus()
+        self.calls = []
+
+    def tearDown(self):
+        EventBus._instance = None
+
+    def _listener(self, name):
+        def callback(event):
+            self.calls.append((name, event.event_type, event.payload))
+        return callback
+
+    def test_emit_calls_higher_priority_first(self):
+        """Listeners run in descending priority, ties in subscribe order."""
+        self.bus.subscribe(GameEvent.SNACK_COLLECTED, self._listener("low"), priority=-1)
+        self.bus.subscribe(GameEvent.SNACK_COLLECTED, self._listener("a"))
+        self.bus.subscribe(GameEvent.SNACK_COLLECTED, self._listener("high"), priority=5)
+        self.bus.subscribe(GameEvent.SNACK_COLLECTED, self._listener("b"))
+
+        self.bus.emit(GameEvent.SNACK_COLLECTED, {"snack_id": "pizza"})
+
+        self.assertEqual([c[0] for c in self.calls], ["high", "a", "b", "low"])
+        self.assertEqual(self.calls[0][2], {"snack_id": "pizza"})
+
+    def test_unsubscribe_removes_listener(self):
+        """An unsubscribed callback is no longer called."""
+        callback = self._listener("a")
+        self.bus.subscribe(GameEvent.PLAY_SOUND, callback)
+        self.bus.unsubscribe(GameEvent.PLAY_SOUND, callback)
+
+        self.bus.emit(GameEvent.PLAY_SOUND, {"sound": "select"})
+
+        self.assertEqual(self.calls, [])
+
+    def test_failing_listener_does_not_block_others(self):
+        """An exception in one listener is reported and the rest still run."""
+        def broken(event):
+            raise RuntimeError("boom")
+
+        self.bus.subscribe(GameEvent.PLAY_SOUND, broken, priority=1)
+        self.bus.subscribe(GameEvent.PLAY_SOUND, self._listener("a"))
+
+        self.bus.emit(GameEvent.PLAY_SOUND)
+
+        self.assertEqual([c[0] for c in self.calls], ["a"])
+
+    def test_queued_events_delivered_on_process(self):
+        """Queued events are held until process_queue() and delivered in order."""
+        self.bus.subscribe(GameEvent.SCORE_CHANGED, self._listener("a"))
+        self.bus.queue_event(GameEvent.SCORE_CHANGED, {"score": 1})
+        self.bus.queue_event(GameEvent.SCORE_CHANGED, {"score": 2})
+        self.assertEqual(self.calls, [])
+
+        self.bus.process_queue()
+
+        self.assertEqual([c[2]["score"] for c in self.calls], [1, 2])
+
+    def test_event_queued_by_listener_runs_next_process(self):
+        """Events queued while processing the queue wait for the next call."""
+        def requeue(event):
+            self.calls.append(("requeue", event.event_type, event.payload))
+            if event.payload["n"] < 2:
+                self.bus.queue_event(GameEvent.SCORE_CHANGED, {"n": event.payload["n"] + 1})
+
+        self.bus.subscribe(GameEvent.SCORE_CHANGED, requeue)
+        self.bus.queue_event(GameEvent.SCORE_CHANGED, {"n": 0})
+
+        self.bus.process_queue()
+        self.assertEqual([c[2]["n"] for c in self.calls], [0])
+        self.bus.process_queue()
+        self.bus.process_queue()
+        self.bus.process_queue()
+        self.assertEqual([c[2]["n"] for c in self.calls], [0, 1, 2])
+
+    def test_clear_listeners(self):
+        """clear_listeners() drops every listener for that event type only."""
+        self.bus.subscribe(GameEvent.PLAY_SOUND, self._listener("sound"))
+        self.bus.subscribe(GameEvent.PLAY_MUSIC, self._listener("music"))
+        self.bus.clear_listeners(GameEvent.PLAY_SOUND)
+
+        self.bus.emit(GameEvent.PLAY_SOUND)
+        self.bus.emit(GameEvent.PLAY_MUSIC)
+
+        self.assertEqual([c[0] for c in self.calls], ["music"])
+
+
+if __name__ == "__main__":
+    unittest.main()
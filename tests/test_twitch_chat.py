@@ -0,0 +1,79 @@
+"""Unit tests for TwitchChatManager connection handling."""
+
+import time
+import unittest
+
+from src.interaction.async_loop import AsyncLoopThread
+from src.interaction.twitch_chat import TwitchChatManager, VOTE_QUEUE_SIZE
+
+
+class TestTwitchChatStart(unittest.TestCase):
+    """Verify start() returns as soon as the bot connects or fails."""
+
+    def setUp(self):
+        self.manager = TwitchChatManager("channel", "token")
+
+    def test_start_returns_on_ready(self):
+        """A successful connection wakes start() immediately."""
+        async def run_bot():
+            self.manager._on_ready()
+
+        self.manager._run_bot = run_bot
+
+        started = time.monotonic()
+        self.assertTrue(self.manager.start())
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertIsNone(self.manager.get_error())
+
+    def test_start_returns_on_error(self):
+        """A connection error wakes start() and is reported."""
+        async def run_bot():
+            self.manager._on_error("bad token")
+
+        self.manager._run_bot = run_bot
+
+        self.assertFalse(self.manager.start())
+        self.assertEqual(self.manager.get_error(), "bad token")
+        self.assertFalse(self.manager.is_connected())
+
+    def test_managers_share_one_loop(self):
+        """Every manager runs its bot on the same named background loop."""
+        other = TwitchChatManager("other", "token")
+        for manager in (self.manager, other):
+            async def run_bot(manager=manager):
+                manager._on_ready()
+
+            manager._run_bot = run_bot
+            self.assertTrue(manager.start())
+
+        self.assertIs(self.manager.loop, other.loop)
+        self.assertIs(self.manager.loop, AsyncLoopThread().get_loop())
+        self.assertEqual(AsyncLoopThread()._thread.name, AsyncLoopThread.THREAD_NAME)
+        self.assertTrue(self.manager.loop.is_running())
+
+
+class TestTwitchChatVotes(unittest.TestCase):
+    """Verify votes are queued in order and bounded."""
+
+    def test_drain_votes_returns_oldest_first_and_empties(self):
+        """Votes come back in arrival order and are only taken once."""
+        manager = TwitchChatManager("channel", "token")
+        manager.vote_queue.append(("extend", "alice"))
+        manager.vote_queue.append(("yank", "bob"))
+
+        self.assertEqual(manager.drain_votes(), [("extend", "alice"), ("yank", "bob")])
+        self.assertEqual(manager.drain_votes(), [])
+
+    def test_vote_queue_drops_oldest_when_full(self):
+        """Chat spam cannot grow the queue past its limit."""
+        manager = TwitchChatManager("channel", "token")
+        for i in range(VOTE_QUEUE_SIZE + 10):
+            manager.vote_queue.append(("extend", str(i)))
+
+        votes = manager.drain_votes()
+        self.assertEqual(len(votes), VOTE_QUEUE_SIZE)
+        self.assertEqual(votes[0], ("extend", "10"))
+
+
+if __name__ == "__main__":
+    unittest.main()